@@ -1,5 +1,6 @@
 """The snmp_r1d1 integration."""
 
+import asyncio
 import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,7 +10,7 @@ from .coordinator import SnmpDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor", "switch", "binary_sensor", "text"]
+PLATFORMS = ("sensor", "switch", "binary_sensor", "text")
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up snmp_r1d1 from a config entry."""
@@ -36,11 +37,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Registered device with id: %s, linked to config_entry_id: %s", device.id, entry.entry_id)
     _LOGGER.debug("Device config_entries: %s", list(device.config_entries))
 
-    _LOGGER.info("Forwarding setup to platforms: %s", PLATFORMS)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
-    _LOGGER.info("Performing first data refresh for coordinator")
-    await coordinator.async_config_entry_first_refresh()
+    # Platform setup only needs validated_oids (built in the coordinator __init__),
+    # so it runs concurrently with the first SNMP poll instead of before it
+    _LOGGER.info("Forwarding setup to platforms %s and performing first data refresh", PLATFORMS)
+    forward_result, refresh_result = await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
+    )
+    if isinstance(refresh_result, BaseException) or isinstance(forward_result, BaseException):
+        # Roll back whatever did set up so HA's setup retry starts from a clean state
+        coordinator.async_abort()
+        # A failed forward may still have loaded some platforms: unload whatever is there
+        try:
+            await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        except Exception as e:
+            _LOGGER.debug("Platform unload during setup rollback failed: %s", e)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator.client is not None:
+            coordinator.client.release()  # the retry creates (and holds) it again
+            coordinator.client = None
+        raise refresh_result if isinstance(refresh_result, BaseException) else forward_result
 
     _LOGGER.info("Integration setup complete for entry_id: %s", entry.entry_id)
     return True
@@ -49,10 +66,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading entry_id: %s", entry.entry_id)
     coordinator: SnmpDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    coordinator._aborted = True  # 🔹 stop polling immediately
+    coordinator.async_abort()  # 🔹 stop polling immediately, cancelling requests in flight
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if coordinator.client is not None:
+            coordinator.client.release()  # pooled SNMP client is only dropped on teardown
+            coordinator.client = None
         _LOGGER.info("Successfully unloaded entry_id: %s", entry.entry_id)
     else:
         _LOGGER.error("Failed to unload platforms for entry_id: %s", entry.entry_id)
@@ -6,7 +6,7 @@ from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from .const import *
 from .coordinator import SnmpDataUpdateCoordinator
-from .helpers import apply_bool_vmap, make_entity_name, make_entity_id
+from .helpers import apply_compiled_bool_vmap, build_bool_vmap_table, compile_bool_vmap, make_entity_name, make_entity_id
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,42 +17,34 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     _LOGGER.info("Starting binary sensor setup for entry_id: %s", config_entry.entry_id)
     coordinator: SnmpDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     device_info_data = config_entry.data.get(CONF_DEVICE_INFO, {})
-    _LOGGER.info("device_info_data[port_count]: %s", device_info_data.get("port_count"))
+    _LOGGER.debug("device_info_data[port_count]: %s", device_info_data.get("port_count"))
 
-    device_info = {
-        "identifiers": {(DOMAIN, config_entry.data[CONF_DEVICE_IP])},
-        "name": config_entry.data[CONF_DEVICE_NAME],
-        "manufacturer": device_info_data.get("manufacturer", "Unknown"),
-        "model": device_info_data.get("model", "Unknown"),
-    }
+    # Device metadata for HA registry is shared, built once on the coordinator
+    device_info = coordinator.device_info
+
+    # Pre-partitioned "binary_sensor" OIDs (built once on the coordinator)
+    binary_oids = coordinator.oids_for_type("binary_sensor")
+    ports_oids = binary_oids["ports"]
+    port_count = int(device_info_data.get("port_count", 1))
+    _LOGGER.debug("Processing %d ports, found %d port entries in validated_oids", port_count, len(ports_oids))
 
     entities = []
 
-    # Device-level binary sensors for "binary_sensor" type OIDs in "device" section
-    device_oids = coordinator.validated_oids.get("device", {})
-    for key, entry in device_oids.items():
-        if entry.get("type") == "binary_sensor":
-            entities.append(SnmpBinarySensor(coordinator, device_info, key, entry))
-            _LOGGER.debug(f"Added device binary sensor: {key}")
-        else:
-            _LOGGER.debug(f"Skipping device OID {key}: type={entry.get('type')}")
+    # Device-level binary sensors
+    for key, entry in binary_oids["device"]:
+        _LOGGER.debug("Adding device binary sensor: %s", key)
+        entities.append(SnmpBinarySensor(coordinator, device_info, key, entry))
 
-    # Port-level binary sensors for "binary_sensor" type OIDs in "ports" section
-    port_count = int(device_info_data.get("port_count", 1))
-    ports_oids = coordinator.validated_oids.get("ports", {})
-    _LOGGER.info("Processing %d ports, found %d port entries in validated_oids", port_count, len(ports_oids))
-    for port_key in sorted(ports_oids.keys(), key=lambda x: int(x[1:])):  # Sort numerically
-        if int(port_key[1:]) > port_count:
-            _LOGGER.warning(f"Skipping port {port_key}: exceeds port_count {port_count}")
+    # Port-level binary sensors
+    for port_key in coordinator.port_keys:  # Pre-sorted numerically, capped at port_count
+        port_attrs = ports_oids.get(port_key)
+        if not port_attrs:
             continue
-        port_attrs = ports_oids[port_key]
-        _LOGGER.debug(f"Processing port {port_key}: attributes={port_attrs}")
-        for key, entry in port_attrs.items():
-            if entry.get("type") == "binary_sensor":
-                entities.append(SnmpPortBinarySensor(coordinator, device_info, key, entry, port_key))
-                _LOGGER.debug(f"Added port binary sensor: {port_key}_{key}")
-            else:
-                _LOGGER.debug(f"Skipping port OID {port_key}_{key}: type={entry.get('type')}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Processing port %s: attributes=%s", port_key, port_attrs)
+        for key, entry in port_attrs:
+            _LOGGER.debug("Adding port binary sensor: %s_%s", port_key, key)
+            entities.append(SnmpPortBinarySensor(coordinator, device_info, key, entry, port_key))
 
     if not entities:
         _LOGGER.info("No binary sensors added. Check validated_oids, port_count, and CONF_ENABLE_CONTROLS: %s",
@@ -75,24 +67,33 @@ class SnmpBinarySensor(BinarySensorEntity):
         self._attr_name = make_entity_name(sensor_type)
         self._attr_device_class = entry.get("device_class")
         self._entry = entry  # Store entry for vmap
+        self._vmap_table = build_bool_vmap_table(entry.get("vmap"))
+        # "<"/">" thresholds cannot be tabulated: only then is the full evaluator compiled
+        self._bool_vmap = compile_bool_vmap(entry.get("vmap")) if self._vmap_table is None else None
+        self._values = coordinator.device_view  # Live read-only view of device values
 
     async def async_added_to_hass(self):
-        self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+        # Only re-written when the rendered value or firmware attribute changed in the last poll
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                "device", (self.sensor_type, "firmware"), self.async_write_ha_state
+            )
+        )
 
     @property
     def is_on(self):
-        if not self.coordinator.data or "device" not in self.coordinator.data:
-            return None
-        raw_value = self.coordinator.data["device"].get(self.sensor_type)
+        raw_value = self._values.get(self.sensor_type)
         if raw_value is None:
             return None
-        return apply_bool_vmap(raw_value, self._entry.get("vmap", {}), self._attr_unique_id)
+        if self._vmap_table is None:  # "<"/">" thresholds need the full evaluator
+            return apply_compiled_bool_vmap(raw_value, self._bool_vmap)
+        return self._vmap_table.get(raw_value, False)
         
     @property
     def extra_state_attributes(self):
-        if not self.coordinator.data or "device" not in self.coordinator.data:
+        if not self._values:
             return {}
-        return {"firmware": self.coordinator.data["device"].get("firmware", "Unknown")}
+        return {"firmware": self._values.get("firmware", "Unknown")}
 
 class SnmpPortBinarySensor(BinarySensorEntity):
     """Representation of a port-level binary sensor."""
@@ -109,24 +110,30 @@ class SnmpPortBinarySensor(BinarySensorEntity):
         self._attr_name = make_entity_name(sensor_type, port_key=padded_port_key)
         self._attr_device_class = entry.get("device_class")
         self._entry = entry  # Store entry for vmap
+        self._vmap_table = build_bool_vmap_table(entry.get("vmap"))
+        # "<"/">" thresholds cannot be tabulated: only then is the full evaluator compiled
+        self._bool_vmap = compile_bool_vmap(entry.get("vmap")) if self._vmap_table is None else None
+        self._values = coordinator.port_view(padded_port_key)  # Live read-only view of this port's values
 
     async def async_added_to_hass(self):
-        self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
+        # Only re-written when the rendered value or port_name attribute changed in the last poll
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                self.padded_port_key, (self.sensor_type, "port_name"), self.async_write_ha_state
+            )
+        )
 
     @property
     def is_on(self):
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
-            return None
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        raw_value = port_data.get(self.sensor_type)
+        raw_value = self._values.get(self.sensor_type)
         if raw_value is None:
             return None
-        return apply_bool_vmap(raw_value, self._entry.get("vmap", {}), self._attr_unique_id)
+        if self._vmap_table is None:  # "<"/">" thresholds need the full evaluator
+            return apply_compiled_bool_vmap(raw_value, self._bool_vmap)
+        return self._vmap_table.get(raw_value, False)
 
     @property
     def extra_state_attributes(self):
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
+        if not self._values:
             return {}
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        port_name = port_data.get("port_name", "Unknown")
-        return {"port_name": port_name}
\ No newline at end of file
+        return {"port_name": self._values.get("port_name", "Unknown")}
\ No newline at end of file
@@ -2,8 +2,10 @@
 
 import ipaddress
 import re
+import socket
+import sys
 import asyncio
-import copy
+from functools import lru_cache
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
@@ -14,26 +16,55 @@ from homeassistant.helpers.entity_registry import async_get as async_get_entity_
 
 import homeassistant.helpers.config_validation as cv
 from .const import *
-from .snmp import SnmpClient, SnmpCredentials
+from .device_loader import load_devices
+from .snmp import NO_SUCH_OID, SnmpClient, SnmpCredentials
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device profiles are only needed by the config/options flows, so they are loaded here
+# rather than in const.py (which every platform imports at integration setup)
+DEVICE_TYPE_OIDS = load_devices()
+
 # Allowed entity types (lowercase)
-ALLOWED_TYPES = ["sensor", "binary_sensor", "switch", "text", "text_sensor",  "mac_table", "mac_port",]
+ALLOWED_TYPES = frozenset(("sensor", "binary_sensor", "switch", "text", "text_sensor", "mac_table", "mac_port"))
+# MAC table/port OIDs are stored as-is and handled by the MAC collection logic
+_MAC_TYPES = frozenset(("mac_table", "mac_port"))
 ALLOWED_CALC_TYPES = ["direct", "diff"]
 
+# Registry removals per event loop turn in the finish step
+_ENTITY_REMOVAL_CHUNK = 50
+
+# Unit applied when an entry has a device_class but no explicit unit
+_DEFAULT_UNITS = {"data_rate": "Bps", "power": "W", "temperature": "°C"}
+
+# Switch vmap key aliases normalized to the "on"/"off" form
+_SWITCH_VMAP_KEY_ALIASES = {"true": "on", "false": "off"}
+
+# Discovered device_info fallbacks as (key, factory); factories keep mutable defaults per flow
+_DEVICE_INFO_DEFAULTS = (
+    ("model", lambda: "SNMP Device"),
+    ("port_count", lambda: "1"),
+    ("firmware", lambda: "Unknown"),
+    ("poe_ports", list),
+)
+
+# Dotted-quad shape; such input is checked by the C-level inet_pton before falling back to ipaddress
+_IPV4_RE = re.compile(r"(?:[0-9]{1,3}\.){3}[0-9]{1,3}")
+
+# One custom OID pair "name:oid": name is everything before the first colon, both sides trimmed
+_CUSTOM_OID_PAIR_RE = re.compile(r"\s*([^:]*?)\s*:\s*(.*?)\s*", re.DOTALL)
+
 def validate_custom_oids(oids_str):
     """Validate custom OIDs in name:oid format."""
     if not oids_str:
         return []
-    pairs = [pair.strip() for pair in oids_str.split(",")]
     result = []
-    for pair in pairs:
-        parts = pair.split(":", 1)  # Split only on the first colon
-        if len(parts) != 2:
+    for pair in oids_str.split(","):
+        match = _CUSTOM_OID_PAIR_RE.fullmatch(pair)  # Split on the first colon and trim in one pass
+        if match is None:
             raise ValueError("Invalid custom OIDs format. Use name:oid (e.g., name1:oid1,name2:oid2).")
-        name, oid = parts[0].strip(), parts[1].strip()
+        name, oid = match.groups()
         if not name or not oid:
             raise ValueError("Invalid custom OIDs format. Name must be non-empty and OID must not be empty")
         # Normalize to always start with "."
@@ -45,10 +76,73 @@ def validate_custom_oids(oids_str):
     return result
 
 
+def _custom_oids_text(value):
+    """Return the custom OIDs form text; older entries stored the parsed [(name, oid)] list."""
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    return ",".join(f"{name}:{oid}" for name, oid in value)
+
+
+# ================================================================
+# Helper: Form schemas
+# ================================================================
+# Field validators never change, so they are built once at import
+_SNMP_VERSION_VALIDATOR = vol.In(SNMP_VERSIONS)
+_POLLING_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_POLLING_INTERVAL, max=MAX_POLLING_INTERVAL))
+_MAC_UPDATE_CYCLE_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_MAC_UPDATE_CYCLE))
+_AUTH_PROTOCOL_VALIDATOR = vol.In(AUTH_PROTOCOLS)
+_PRIVACY_PROTOCOL_VALIDATOR = vol.In(PRIVACY_PROTOCOLS)
+# Field-less schema for forms that only report an error
+_EMPTY_SCHEMA = vol.Schema({})
+# Read-only single-line text field used by the present step summary
+_TEXT_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
+
+
+def _join_sorted(names):
+    """Join entity names for display, sorted and comma separated."""
+    return ", ".join(sorted(names))
+
+
+def _settings_schema(data):
+    """Build the settings form schema; only the defaults depend on the flow data."""
+    return vol.Schema({
+        vol.Required(CONF_SNMP_VERSION, default=data.get(CONF_SNMP_VERSION, "v2c")): _SNMP_VERSION_VALIDATOR,
+        vol.Required(CONF_POLLING_INTERVAL, default=int(data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL))): _POLLING_INTERVAL_VALIDATOR,
+        vol.Required(CONF_MAC_UPDATE_CYCLE, default=int(data.get(CONF_MAC_UPDATE_CYCLE, DEFAULT_MAC_UPDATE_CYCLE))): _MAC_UPDATE_CYCLE_VALIDATOR,
+        vol.Required(CONF_ENABLE_CONTROLS, default=data.get(CONF_ENABLE_CONTROLS, False)): bool,
+        vol.Optional(CONF_CUSTOM_OIDS, default=_custom_oids_text(data.get(CONF_CUSTOM_OIDS))): str,
+    })
+
+
+# ================================================================
+# Helper: Validate device IP address
+# ================================================================
+def validate_ip_address(value: str) -> None:
+    """Raise ValueError if value is not a valid IPv4/IPv6 address."""
+    if _IPV4_RE.fullmatch(value):
+        try:
+            socket.inet_pton(socket.AF_INET, value)
+            return
+        except OSError:
+            pass
+    # IPv6 and anything inet_pton rejected: ipaddress gives the canonical error message
+    ipaddress.ip_address(value)
+
 
 # ================================================================
 # Helper: Validate MAC OID via shallow walk
 # ================================================================
+@lru_cache(maxsize=256)
+def _oid_tuple(oid: str):
+    """Parse a dotted OID (leading dot optional) into a tuple of ints, or None if not numeric."""
+    try:
+        return tuple(int(part) for part in oid.lstrip(".").split("."))
+    except ValueError:
+        return None
+
+
 async def validate_mac_oid(client, oid: str, key: str, section: str, logger=_LOGGER) -> bool:
     """Check if a MAC-related OID exists by doing a single GETNEXT and verifying root."""
 
@@ -65,8 +159,15 @@ async def validate_mac_oid(client, oid: str, key: str, section: str, logger=_LOG
         value = result.get("value")
         logger.debug("validate_mac_oid: first_oid=%s, value=%s", first_oid, value)
 
-        # Normalize both sides: strip leading dot
-        if first_oid.lstrip(".").startswith(oid.lstrip(".")):
+        # Compare numerically by sub-identifier (leading dot irrelevant, and "...1.1" no
+        # longer matches "...1.10"); fall back to the string prefix check for non-numeric OIDs
+        root = _oid_tuple(oid)
+        first = _oid_tuple(first_oid)
+        if root is not None and first is not None:
+            in_subtree = first[:len(root)] == root
+        else:
+            in_subtree = first_oid.lstrip(".").startswith(oid.lstrip("."))
+        if in_subtree:
             logger.debug(
                 "Validated MAC OID %s for %s in %s via GETNEXT (first_oid=%s, value=%s)",
                 oid, key, section, first_oid, value
@@ -92,7 +193,7 @@ def _process_options(entry, key, section, entity_type, errors, log_context):
     options = {}
 
     # Calc
-    calc_type = str(entry.get("calc", "direct")).lower()
+    calc_type = sys.intern(str(entry.get("calc", "direct")).lower())
     options["calc"] = calc_type
 
     # Optional math
@@ -109,29 +210,21 @@ def _process_options(entry, key, section, entity_type, errors, log_context):
             _LOGGER.error("Invalid unit for %s in %s: %s", key, log_context, unit)
             errors["base"] = "invalid_unit"
     else:
-        dev_class = entry.get("device_class")
-        if dev_class == "data_rate":
-            options["native_unit_of_measurement"] = "Bps"
-        elif dev_class == "power":
-            options["native_unit_of_measurement"] = "W"
-        elif dev_class == "temperature":
-            options["native_unit_of_measurement"] = "°C"
+        default_unit = _DEFAULT_UNITS.get(entry.get("device_class"))
+        if default_unit is not None:
+            options["native_unit_of_measurement"] = default_unit
 
     # vmap
     vmap = entry.get("vmap")
     if vmap:
         if entity_type == "switch":
-            remapped_vmap = {}
-            if "true" in vmap:
-                remapped_vmap["on"] = vmap["true"]
-                _LOGGER.debug("Remapped vmap key 'true' to 'on' for %s in %s", key, log_context)
-            if "false" in vmap:
-                remapped_vmap["off"] = vmap["false"]
-                _LOGGER.debug("Remapped vmap key 'false' to 'off' for %s in %s", key, log_context)
-            for k, v in vmap.items():
-                if k not in ("true", "false"):
-                    remapped_vmap[k] = v
-            vmap = remapped_vmap
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                if "true" in vmap:
+                    _LOGGER.debug("Remapped vmap key 'true' to 'on' for %s in %s", key, log_context)
+                if "false" in vmap:
+                    _LOGGER.debug("Remapped vmap key 'false' to 'off' for %s in %s", key, log_context)
+            # "true"/"false" keys become "on"/"off" in a single pass
+            vmap = {_SWITCH_VMAP_KEY_ALIASES.get(k, k): v for k, v in vmap.items()}
         try:
             validate_vmap(vmap, entity_type)
             options["vmap"] = vmap
@@ -147,82 +240,84 @@ def _process_options(entry, key, section, entity_type, errors, log_context):
 
     return options
 
+# Accepted vmap key signatures for switch / binary_sensor
+_BOOL_VMAP_KEY_SIGS = (frozenset(("on", "off")), frozenset(("1", "0")))
+# "<n"/">n" comparison tokens: prefix set and the numeric operand they must carry
+_CMP_PREFIX = ("<", ">")
+_NUM_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+def _validate_switch_vmap(vmap):
+    """Switch: {"on","off"} or {"1","0"} keys with string values."""
+    keys = vmap.keys()
+    if not any(keys == sig for sig in _BOOL_VMAP_KEY_SIGS):
+        raise ValueError(
+            "Switch vmap must be {'on': '<val>', 'off': '<val>'} "
+            "or {'1': '<val>', '0': '<val>'}"
+        )
+    # All values must be strings
+    if not all(isinstance(v, str) for v in vmap.values()):
+        raise ValueError("Switch vmap values must be strings")
+
+
+def _validate_binary_sensor_vmap(vmap):
+    """Binary sensor: {"on","off"} or {"1","0"} keys; values are strings or lists of strings/comparisons."""
+    keys = vmap.keys()
+    if not any(keys == sig for sig in _BOOL_VMAP_KEY_SIGS):
+        raise ValueError(
+            "Binary_sensor vmap must be {'on': [...], 'off': [...]} "
+            "or {'1': '<val>', '0': '<val>'}"
+        )
+    # Iterate through each vmap entry
+    for k, v in vmap.items():
+        # If list: each element must be string or comparison
+        if isinstance(v, list):
+            for token in v:
+                if not isinstance(token, str):
+                    raise ValueError(
+                        "Binary_sensor vmap list values must be strings"
+                    )
+                if token[:1] in _CMP_PREFIX and not _NUM_RE.fullmatch(token, 1):
+                    raise ValueError(
+                        f"Invalid vmap comparison value in {token}"
+                    )
+        # If single string: must be string
+        elif not isinstance(v, str):
+            raise ValueError("Binary_sensor vmap values must be strings")
+
+
+def _validate_sensor_vmap(vmap):
+    """Sensor: string keys/values; "<n"/">n" keys must be numeric comparisons."""
+    for key, value in vmap.items():
+        # Comparison key must be numeric
+        if isinstance(key, str) and key[:1] in _CMP_PREFIX:
+            if not _NUM_RE.fullmatch(key, 1):
+                raise ValueError(
+                    f"Invalid vmap comparison value in {key}"
+                )
+        # Keys and values must be strings
+        elif not isinstance(key, str) or not isinstance(value, str):
+            raise ValueError("Sensor vmap keys and values must be strings")
+
+
+_VMAP_VALIDATORS = {
+    "switch": _validate_switch_vmap,
+    "binary_sensor": _validate_binary_sensor_vmap,
+    "sensor": _validate_sensor_vmap,
+}
+
+
 def validate_vmap(vmap, entity_type):
 
     # vmap must always be a dictionary
     if not isinstance(vmap, dict):
         raise ValueError("vmap must be a dictionary")
 
-    # ------------------------------
-    # Switch validation
-    # ------------------------------
-    if entity_type == "switch":
-        valid_keys = {"on", "off"}
-        alt_keys = {"1", "0"}
-        # Accept only {"on","off"} or {"1","0"}
-        if not (set(vmap.keys()) == valid_keys or set(vmap.keys()) == alt_keys):
-            raise ValueError(
-                "Switch vmap must be {'on': '<val>', 'off': '<val>'} "
-                "or {'1': '<val>', '0': '<val>'}"
-            )
-        # All values must be strings
-        if not all(isinstance(v, str) for v in vmap.values()):
-            raise ValueError("Switch vmap values must be strings")
-
-    # ------------------------------
-    # Binary sensor validation
-    # ------------------------------
-    elif entity_type == "binary_sensor":
-        valid_keys = {"on", "off"}
-        alt_keys = {"1", "0"}
-        # Accept {"on","off"} or {"1","0"}
-        if not (set(vmap.keys()) == valid_keys or set(vmap.keys()) == alt_keys):
-            raise ValueError(
-                "Binary_sensor vmap must be {'on': [...], 'off': [...]} "
-                "or {'1': '<val>', '0': '<val>'}"
-            )
-        # Iterate through each vmap entry
-        for k, v in vmap.items():
-            # If list: each element must be string or comparison
-            if isinstance(v, list):
-                for token in v:
-                    if token.startswith(("<", ">")):
-                        try:
-                            float(token[1:])  # must parse as number
-                        except ValueError:
-                            raise ValueError(
-                                f"Invalid vmap comparison value in {token}"
-                            )
-                    elif not isinstance(token, str):
-                        raise ValueError(
-                            "Binary_sensor vmap list values must be strings"
-                        )
-            # If single string: must be string
-            elif not isinstance(v, str):
-                raise ValueError("Binary_sensor vmap values must be strings")
-
-    # ------------------------------
-    # Sensor validation
-    # ------------------------------
-    elif entity_type == "sensor":
-        for key, value in vmap.items():
-            # Comparison key must be numeric
-            if key.startswith(("<", ">")):
-                try:
-                    float(key[1:])
-                except ValueError:
-                    raise ValueError(
-                        f"Invalid vmap comparison value in {key}"
-                    )
-            # Keys and values must be strings
-            elif not isinstance(key, str) or not isinstance(value, str):
-                raise ValueError("Sensor vmap keys and values must be strings")
-
-    # ------------------------------
-    # Other entity types: not supported
-    # ------------------------------
-    else:
+    # Dispatch by entity type; other entity types are not supported
+    validator = _VMAP_VALIDATORS.get(entity_type)
+    if validator is None:
         raise ValueError(f"Unsupported entity type {entity_type} for vmap")
+    validator(vmap)
 
 
 def _log_oids_pretty(level: str, label: str, oids: dict, logger=_LOGGER) -> None:
@@ -234,24 +329,28 @@ def _log_oids_pretty(level: str, label: str, oids: dict, logger=_LOGGER) -> None
         oids: OID dict to format (configured_oids or validated_oids)
         logger: Logger instance
     """
-    lines = [f"{label}:"]
-    for section, entries in oids.items():
-        lines.append(f"  {section}:")
-        if isinstance(entries, dict):
+    # Skip building the (potentially large) block when the level is disabled
+    level_num = getattr(logging, level.upper(), logging.DEBUG)
+    if not logger.isEnabledFor(level_num):
+        return
+
+    def _gen():
+        yield f"{label}:"
+        for section, entries in oids.items():
+            yield f"  {section}:"
+            if not isinstance(entries, dict):
+                continue
             for key, entry in entries.items():
-                if isinstance(entry, dict):
-                    if any(isinstance(v, dict) for v in entry.values()):
-                        lines.append(f"    {key}:")
-                        for attr, val in entry.items():
-                            lines.append(f"      {attr}: {val}")
-                    else:
-                        oid = entry.get("oid", "na")
-                        etype = entry.get("type", "?")
-                        lines.append(f"    {key}: [{etype}] {oid}")
+                if not isinstance(entry, dict):
+                    yield f"    {key}: {entry}"
+                elif any(isinstance(v, dict) for v in entry.values()):
+                    yield f"    {key}:"
+                    for attr, val in entry.items():
+                        yield f"      {attr}: {val}"
                 else:
-                    lines.append(f"    {key}: {entry}")
-    log_fn = getattr(logger, level, logger.debug)
-    log_fn("\n".join(lines))
+                    yield f"    {key}: [{entry.get('type', '?')}] {entry.get('oid', 'na')}"
+
+    logger.log(level_num, "\n".join(_gen()))
 
 
 class SnmpFlowHelper:
@@ -265,8 +364,8 @@ class SnmpFlowHelper:
         if user_input is not None:
             _LOGGER.debug("        Step settings user_input: %s", user_input)
             try:
-                if user_input.get(CONF_CUSTOM_OIDS):
-                    user_input[CONF_CUSTOM_OIDS] = validate_custom_oids(user_input[CONF_CUSTOM_OIDS])
+                # Keep the user's text in the data (it is the form default); parse it once here
+                flow._parsed_custom_oids = validate_custom_oids(user_input.get(CONF_CUSTOM_OIDS))
                 user_input[CONF_POLLING_INTERVAL] = int(user_input[CONF_POLLING_INTERVAL])
                 user_input[CONF_MAC_UPDATE_CYCLE] = int(user_input[CONF_MAC_UPDATE_CYCLE])
                 flow._data.update(user_input)
@@ -281,13 +380,7 @@ class SnmpFlowHelper:
         _LOGGER.debug("        Step settings rendering form with data: %s", flow._data)
         return flow.async_show_form(
             step_id="settings",
-            data_schema=vol.Schema({
-                vol.Required(CONF_SNMP_VERSION, default=flow._data.get(CONF_SNMP_VERSION, "v2c")): vol.In(SNMP_VERSIONS),
-                vol.Required(CONF_POLLING_INTERVAL, default=int(flow._data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL))): vol.All(vol.Coerce(int), vol.Range(min=MIN_POLLING_INTERVAL, max=MAX_POLLING_INTERVAL)),
-                vol.Required(CONF_MAC_UPDATE_CYCLE, default=int(flow._data.get(CONF_MAC_UPDATE_CYCLE, DEFAULT_MAC_UPDATE_CYCLE))): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_MAC_UPDATE_CYCLE)),
-                vol.Required(CONF_ENABLE_CONTROLS, default=flow._data.get(CONF_ENABLE_CONTROLS, False)): bool,
-                vol.Optional(CONF_CUSTOM_OIDS, default=flow._data.get(CONF_CUSTOM_OIDS, "")): str,
-            }),
+            data_schema=_settings_schema(flow._data),
             errors=errors,
         )
 
@@ -311,17 +404,18 @@ class SnmpFlowHelper:
                 return await flow.async_step_test()
 
             _LOGGER.debug("        Step credentials preparing form")
-            snmp_version = flow._data.get(CONF_SNMP_VERSION, "v2c")
+            data = flow._data
+            snmp_version = data.get(CONF_SNMP_VERSION, "v2c")
             _LOGGER.debug("        Step credentials using SNMP version: %s", snmp_version)
             defaults = {
                 CONF_GO_BACK: False,
-                CONF_READ_COMMUNITY_STRING: flow._data.get(CONF_READ_COMMUNITY_STRING, ""),
-                CONF_WRITE_COMMUNITY_STRING: flow._data.get(CONF_WRITE_COMMUNITY_STRING, ""),
-                CONF_USERNAME: flow._data.get(CONF_USERNAME, ""),
-                CONF_AUTH_PROTOCOL: flow._data.get(CONF_AUTH_PROTOCOL, "None"),
-                CONF_AUTH_KEY: flow._data.get(CONF_AUTH_KEY, ""),
-                CONF_PRIVACY_PROTOCOL: flow._data.get(CONF_PRIVACY_PROTOCOL, "None"),
-                CONF_PRIVACY_KEY: flow._data.get(CONF_PRIVACY_KEY, "")
+                CONF_READ_COMMUNITY_STRING: data.get(CONF_READ_COMMUNITY_STRING, ""),
+                CONF_WRITE_COMMUNITY_STRING: data.get(CONF_WRITE_COMMUNITY_STRING, ""),
+                CONF_USERNAME: data.get(CONF_USERNAME, ""),
+                CONF_AUTH_PROTOCOL: data.get(CONF_AUTH_PROTOCOL, "None"),
+                CONF_AUTH_KEY: data.get(CONF_AUTH_KEY, ""),
+                CONF_PRIVACY_PROTOCOL: data.get(CONF_PRIVACY_PROTOCOL, "None"),
+                CONF_PRIVACY_KEY: data.get(CONF_PRIVACY_KEY, "")
             }
             _LOGGER.debug("        Step credentials defaults: go_back=%s, read_community_string=%s, write_community_string=%s",
                         defaults[CONF_GO_BACK], defaults[CONF_READ_COMMUNITY_STRING], defaults[CONF_WRITE_COMMUNITY_STRING])
@@ -331,19 +425,22 @@ class SnmpFlowHelper:
                 vol.Optional(CONF_GO_BACK, default=defaults[CONF_GO_BACK]): bool,
                 vol.Required(CONF_READ_COMMUNITY_STRING, default=defaults[CONF_READ_COMMUNITY_STRING]): str,
                 vol.Optional(CONF_WRITE_COMMUNITY_STRING, default=defaults[CONF_WRITE_COMMUNITY_STRING]): str,
-            } if snmp_version in ["v1", "v2c"] else {
+            } if snmp_version in ("v1", "v2c") else {
                 vol.Optional(CONF_GO_BACK, default=defaults[CONF_GO_BACK]): bool,
                 vol.Required(CONF_USERNAME, default=defaults[CONF_USERNAME]): str,
-                vol.Required(CONF_AUTH_PROTOCOL, default=defaults[CONF_AUTH_PROTOCOL]): vol.In(AUTH_PROTOCOLS),
+                vol.Required(CONF_AUTH_PROTOCOL, default=defaults[CONF_AUTH_PROTOCOL]): _AUTH_PROTOCOL_VALIDATOR,
                 vol.Optional(CONF_AUTH_KEY, default=defaults[CONF_AUTH_KEY]): str,
-                vol.Required(CONF_PRIVACY_PROTOCOL, default=defaults[CONF_PRIVACY_PROTOCOL]): vol.In(PRIVACY_PROTOCOLS),
+                vol.Required(CONF_PRIVACY_PROTOCOL, default=defaults[CONF_PRIVACY_PROTOCOL]): _PRIVACY_PROTOCOL_VALIDATOR,
                 vol.Optional(CONF_PRIVACY_KEY, default=defaults[CONF_PRIVACY_KEY]): str,
             }
-            _LOGGER.debug("        Step credentials schema created: %s", schema)
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                _LOGGER.debug("        Step credentials schema created: %s", schema)
 
             _LOGGER.debug("        Step credentials creating form schema")
             form_schema = vol.Schema(schema)
-            _LOGGER.debug("        Step credentials form schema: %s", form_schema.schema)
+            if debug_enabled:
+                _LOGGER.debug("        Step credentials form schema: %s", form_schema.schema)
             _LOGGER.debug("        Step credentials schema validation complete")
 
             _LOGGER.debug("        Step credentials calling async_show_form")
@@ -352,7 +449,8 @@ class SnmpFlowHelper:
                 data_schema=form_schema,
                 errors=errors
             )
-            _LOGGER.debug("        Step credentials form render result: %s", result)
+            if debug_enabled:
+                _LOGGER.debug("        Step credentials form render result: %s", result)
             return result
         except Exception as e:
             _LOGGER.error("        Step credentials error: %s", e)
@@ -360,7 +458,7 @@ class SnmpFlowHelper:
             _LOGGER.debug("        Step credentials returning fallback form")
             return flow.async_show_form(
                 step_id="credentials",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors=errors
             )
 
@@ -369,12 +467,8 @@ class SnmpFlowHelper:
         """Test SNMP connection using access_test_oid."""
         _LOGGER.info("# Entering step test")
         errors = {}
-        credentials = SnmpCredentials(
-            version=flow._data.get(CONF_SNMP_VERSION, "v2c"),
-            read_community=flow._data.get(CONF_READ_COMMUNITY_STRING, ""),
-            write_community=flow._data.get(CONF_WRITE_COMMUNITY_STRING)
-        )
-        client = await SnmpClient.create(flow._data[CONF_DEVICE_IP], credentials)
+        client = await SnmpFlowHelper.get_client(flow)
+        credentials = client.credentials
 
         vendor_oids = DEVICE_TYPE_OIDS[flow._data[CONF_DEVICE_TYPE]]
         test_oid = vendor_oids.get("config", {}).get("access_test_oid")
@@ -425,20 +519,47 @@ class SnmpFlowHelper:
         """Discover device attributes."""
         _LOGGER.info("# Entering step discover")
         errors = {}
-        credentials = SnmpCredentials(
-            version=flow._data.get(CONF_SNMP_VERSION, "v2c"),
-            read_community=flow._data.get(CONF_READ_COMMUNITY_STRING, ""),
-            write_community=flow._data.get(CONF_WRITE_COMMUNITY_STRING)
-        )
-        client = await SnmpClient.create(flow._data[CONF_DEVICE_IP], credentials)
+        client = await SnmpFlowHelper.get_client(flow)
         _LOGGER.debug("        Step discover created SNMP client")
 
         flow._device_info = {}
 
+        # Resolve the device profile and its sections once for the whole step
         vendor_oids = DEVICE_TYPE_OIDS[flow._data[CONF_DEVICE_TYPE]]
+        attributes = vendor_oids.get("attributes", {})
+        device_section = vendor_oids.get("device", {})
+        config_section = vendor_oids.get("config", {})
+
+        # Fetch every scalar attribute/device OID in batched GETs up front;
+        # the PoE port list is a subtree walk and stays separate
+        scalar_oids = [
+            entry.get("oid", "na")
+            for section_entries in (attributes, device_section)
+            for attr, entry in section_entries.items()
+            if entry.get("oid", "na") != "na"
+            and not (attr == "poe_port_list" and entry.get("mode") == "WalkforList")
+        ]
+        try:
+            scalar_values = await client.async_get_many(scalar_oids)
+        except Exception as e:
+            _LOGGER.warning("        Step discover batched fetch failed: %s", e)
+            scalar_values = {}
+
+        def _store_scalar(attr, oid):
+            if oid not in scalar_values:
+                _LOGGER.warning("        Step discover failed to fetch %s with OID %s", attr, oid)
+                flow._device_info[attr] = "Unknown"
+                return
+            value = scalar_values[oid]
+            if value is not None and value is not NO_SUCH_OID:  # Accept "" for no data
+                flow._device_info[attr] = value or "None"  # Store "None" for empty data
+                _LOGGER.info("        Step discover discovered %s: %s via OID %s", attr, value, oid)
+            else:
+                _LOGGER.warning("        Step discover OID %s for %s is invalid", oid, attr)
+                flow._device_info[attr] = "Unknown"
 
         # Handle attributes
-        for attr, entry in vendor_oids.get("attributes", {}).items():
+        for attr, entry in attributes.items():
             oid = entry.get("oid", "na")
             if oid == "na":
                 flow._device_info[attr] = "Unknown"
@@ -457,13 +578,7 @@ class SnmpFlowHelper:
                     else:
                         _LOGGER.debug("        Step discover no PoE ports found for OID %s", oid)
                 else:
-                    value = await client.async_get(oid)
-                    if value is not None:  # Accept "" for no data
-                        flow._device_info[attr] = value or "None"  # Store "None" for empty data
-                        _LOGGER.info("        Step discover discovered %s: %s via OID %s", attr, value, oid)
-                    else:
-                        _LOGGER.warning("        Step discover OID %s for %s is invalid", oid, attr)
-                        flow._device_info[attr] = "Unknown"
+                    _store_scalar(attr, oid)
             except Exception as e:
                 _LOGGER.warning("        Step discover failed to fetch %s with OID %s: %s", attr, oid, e)
                 flow._device_info[attr] = "Unknown"
@@ -471,34 +586,25 @@ class SnmpFlowHelper:
                     flow._device_info["poe_ports"] = []
 
         # Handle device attributes
-        for attr, entry in vendor_oids.get("device", {}).items():
+        for attr, entry in device_section.items():
             oid = entry.get("oid", "na")
             if oid == "na":
                 flow._device_info[attr] = "Unknown"
                 _LOGGER.debug("        Step discover skipped %s: marked as 'na'", attr)
                 continue
-            try:
-                value = await client.async_get(oid)
-                if value is not None:  # Accept "" for no data
-                    flow._device_info[attr] = value or "None"
-                    _LOGGER.info("        Step discover discovered %s: %s via OID %s", attr, value, oid)
-                else:
-                    _LOGGER.warning("        Step discover OID %s for %s is invalid", oid, attr)
-                    flow._device_info[attr] = "Unknown"
-            except Exception as e:
-                _LOGGER.warning("        Step discover failed to fetch %s with OID %s: %s", attr, oid, e)
-                flow._device_info[attr] = "Unknown"
+            _store_scalar(attr, oid)
 
         # Fallback defaults
-        device_type = flow._data.get(CONF_DEVICE_TYPE, "Unknown")
-        manufacturer_fallback = device_type.split("_")[0].capitalize()
-        flow._device_info.setdefault("manufacturer", manufacturer_fallback)
-        flow._device_info.setdefault("model", "SNMP Device")
-        flow._device_info.setdefault("port_count", "1")
-        flow._device_info.setdefault("firmware", "Unknown")
-        flow._device_info.setdefault("poe_ports", [])
+        device_info = flow._device_info
+        if "manufacturer" not in device_info:
+            device_type = flow._data.get(CONF_DEVICE_TYPE, "Unknown")
+            device_info["manufacturer"] = device_type.split("_")[0].capitalize()
+        for key, factory in _DEVICE_INFO_DEFAULTS:
+            if key not in device_info:
+                device_info[key] = factory()
         # get the excluded ports
-        flow._device_info.setdefault("excluded_ports", vendor_oids.get("config", {}).get("port_exclude", []))
+        if "excluded_ports" not in device_info:
+            device_info["excluded_ports"] = config_section.get("port_exclude", [])
 
         _LOGGER.info("        Step discover device info: %s", flow._device_info)
         _LOGGER.info("        Step discover proceeding to parse_config")
@@ -508,6 +614,8 @@ class SnmpFlowHelper:
     async def handle_parse_config(flow, user_input=None):
         """Parse configuration and structure OIDs."""
         _LOGGER.info("# Entering step parse_config")
+        # One dict for the whole step: every path that sets "base" returns immediately,
+        # so it is still empty whenever the next entry is processed
         errors = {}
         try:
             # Validate user_input
@@ -516,18 +624,13 @@ class SnmpFlowHelper:
                 errors["base"] = "invalid_input"
                 return flow.async_show_form(
                     step_id="settings",
-                    data_schema=vol.Schema({
-                        vol.Required(CONF_SNMP_VERSION, default=flow._data.get(CONF_SNMP_VERSION, "v2c")): vol.In(SNMP_VERSIONS),
-                        vol.Required(CONF_POLLING_INTERVAL, default=int(flow._data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL))): vol.All(vol.Coerce(int), vol.Range(min=MIN_POLLING_INTERVAL, max=MAX_POLLING_INTERVAL)),
-                        vol.Required(CONF_MAC_UPDATE_CYCLE, default=int(flow._data.get(CONF_MAC_UPDATE_CYCLE, DEFAULT_MAC_UPDATE_CYCLE))): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_MAC_UPDATE_CYCLE)),
-                        vol.Required(CONF_ENABLE_CONTROLS, default=flow._data.get(CONF_ENABLE_CONTROLS, False)): bool,
-                        vol.Optional(CONF_CUSTOM_OIDS, default=flow._data.get(CONF_CUSTOM_OIDS, "")): str,
-                    }),
+                    data_schema=_settings_schema(flow._data),
                     errors=errors
                 )
 
             vendor_oids = DEVICE_TYPE_OIDS[flow._data[CONF_DEVICE_TYPE]]
             enable_controls = flow._data.get(CONF_ENABLE_CONTROLS, False)
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)  # gates the per-entry debug logs
             port_count = int(flow._device_info.get("port_count", 1))
             poe_ports = [int(port) for port in flow._device_info.get("poe_ports", [])]
             excluded_ports = flow._device_info.get("excluded_ports", [])
@@ -536,40 +639,36 @@ class SnmpFlowHelper:
             flow._configured_oids = {"attributes": {}, "device": {}, "ports": {}}
 
             # Parse attributes and device sections
-            for section in ["attributes", "device"]:
+            for section in ("attributes", "device"):
                 for key, entry in vendor_oids.get(section, {}).items():
-                    errors = {}  # reset per entry
                     if not isinstance(entry, dict):
                         _LOGGER.error("Invalid entry for %s in %s: %s, expected dict", key, section, entry)
                         errors["base"] = "invalid_config"
-                        return flow.async_show_form(step_id="settings", data_schema=vol.Schema({}), errors=errors)
+                        return flow.async_show_form(step_id="settings", data_schema=_EMPTY_SCHEMA, errors=errors)
 
                     oid = entry.get("oid", "na")
                     if oid == "na":
                         _LOGGER.debug("Skipping OID %s in %s: marked as 'na'", key, section)
                         continue
 
-                    _configured_entry = entry.copy()
-
                     # Normalize entity type
-                    entity_type = entry.get("type", "sensor").lower()
-                    if entity_type in ("mac_table", "mac_port"):
+                    entity_type = sys.intern(entry.get("type", "sensor").lower())
+                    if entity_type in _MAC_TYPES:
                         flow._configured_oids[section][key] = entry
                         _LOGGER.debug("Added special MAC OID for %s in %s: %s", key, section, entry)
                         continue
                     if entity_type not in ALLOWED_TYPES:
-                        error_msg = f"Invalid type '{entity_type}'. Allowed types are: {', '.join(ALLOWED_TYPES)}"
+                        error_msg = f"Invalid type '{entity_type}'. Allowed types are: {', '.join(sorted(ALLOWED_TYPES))}"
                         _LOGGER.error(error_msg)
                         errors["base"] = "invalid_type"
-                        return flow.async_show_form(step_id="settings", data_schema=vol.Schema({}), errors={"base": error_msg})
-                    _configured_entry["type"] = entity_type
+                        return flow.async_show_form(step_id="settings", data_schema=_EMPTY_SCHEMA, errors={"base": error_msg})
 
-                    #  Process Options  calc/math/unit/vmap handling
+                    #  Process Options  calc/math/unit/vmap handling, merged in a single dict build
                     options = _process_options(entry, key, section, entity_type, errors, section)
-                    _configured_entry.update(options)
+                    _configured_entry = {**entry, "type": entity_type, **options}
 
                     if errors.get("base"):
-                        return flow.async_show_form(step_id="settings", data_schema=vol.Schema({}), errors=errors)
+                        return flow.async_show_form(step_id="settings", data_schema=_EMPTY_SCHEMA, errors=errors)
 
                     # Adjust types if controls disabled
                     if section == "device" and entity_type == "switch" and not enable_controls:
@@ -585,78 +684,81 @@ class SnmpFlowHelper:
 
             # Parse ports section
             if "ports" in vendor_oids:
+                # Per-key invariants resolved once instead of once per port:
+                # (key, entry, base oid, normalized entity type, is PoE attribute)
+                port_items = [
+                    (key, entry, entry.get("oid", "na"), sys.intern(entry.get("type", "sensor").lower()), key.startswith("poe_"))
+                    if isinstance(entry, dict) else (key, entry, None, None, False)
+                    for key, entry in vendor_oids["ports"].items()
+                ]
+                poe_set = frozenset(poe_ports)
+                excluded_set = frozenset(excluded_ports)
+                port_templates = {}  # key -> entry with options applied, shared by all ports
                 for port in range(1, port_count + 1):
-                    if port in excluded_ports:
+                    if port in excluded_set:
                         _LOGGER.info("Skipping excluded port %s", port)
                         continue
                     port_key = f"p{port:02d}"
                     flow._configured_oids["ports"][port_key] = {}
                     try:
-                        for key, entry in vendor_oids["ports"].items():
-                            errors = {}  # reset per entry
-                            _LOGGER.debug("        Processing OID %s for %s", key, port_key)
-                            if not isinstance(entry, dict):
+                        for key, entry, oid, entity_type, is_poe in port_items:
+                            if debug_enabled:
+                                _LOGGER.debug("        Processing OID %s for %s", key, port_key)
+                            if entity_type is None:
                                 _LOGGER.error("        Invalid entry for %s in ports for %s: %s, expected dict", key, port_key, entry)
                                 errors["base"] = "invalid_config"
-                                return flow.async_show_form(step_id="settings", data_schema=vol.Schema({}), errors=errors)
+                                return flow.async_show_form(step_id="settings", data_schema=_EMPTY_SCHEMA, errors=errors)
 
-                            oid = entry.get("oid", "na")
                             if oid == "na":
-                                _LOGGER.debug("        Skipping OID %s for %s in ports: marked as 'na'", key, port_key)
+                                if debug_enabled:
+                                    _LOGGER.debug("        Skipping OID %s for %s in ports: marked as 'na'", key, port_key)
                                 continue
-                            if key.startswith("poe_") and port not in poe_ports:
-                                _LOGGER.debug("        Skipping PoE attribute %s for non-PoE port %s", key, port_key)
+                            if is_poe and port not in poe_set:
+                                if debug_enabled:
+                                    _LOGGER.debug("        Skipping PoE attribute %s for non-PoE port %s", key, port_key)
                                 continue
 
                             port_oid = f"{oid}.{port}"
-                            _configured_entry = entry.copy()
-                            _configured_entry["oid"] = port_oid
 
-                            entity_type = entry.get("type", "sensor").lower()
                             if entity_type not in ALLOWED_TYPES:
                                 _LOGGER.error("        Invalid type %s for %s in %s", entity_type, key, port_key)
                                 errors["base"] = "invalid_type"
-                                return flow.async_show_form(step_id="settings", data_schema=vol.Schema({}), errors=errors)
-                            _configured_entry["type"] = entity_type
-
-                            # 🔹 replace manual calc/math/unit/vmap with helper
-                            options = _process_options(entry, key, port_key, entity_type, errors, port_key)
-                            _configured_entry.update(options)
-
-                            if errors.get("base"):
-                                return flow.async_show_form(step_id="settings", data_schema=vol.Schema({}), errors=errors)
-
-                            # Adjust type if controls disabled
-                            if entity_type == "switch" and not enable_controls:
-                                _configured_entry["type"] = "binary_sensor"
-                                _LOGGER.debug("        Adjusted type for %s to binary_sensor (read-only) for %s", key, port_key)
-                            elif entity_type == "text" and not enable_controls:
-                                _configured_entry["type"] = "text_sensor"
-                                _LOGGER.debug("        Adjusted type for %s to text_sensor (read-only) for %s", key, port_key)
-
+                                return flow.async_show_form(step_id="settings", data_schema=_EMPTY_SCHEMA, errors=errors)
+
+                            # calc/math/unit/vmap only depend on the key, so they are resolved on
+                            # first use and every port entry is copied from that template
+                            template = port_templates.get(key)
+                            if template is None:
+                                options = _process_options(entry, key, port_key, entity_type, errors, port_key)
+                                if errors.get("base"):
+                                    return flow.async_show_form(step_id="settings", data_schema=_EMPTY_SCHEMA, errors=errors)
+                                template = {**entry, "type": entity_type, **options}
+
+                                # Adjust type if controls disabled
+                                if entity_type == "switch" and not enable_controls:
+                                    template["type"] = "binary_sensor"
+                                    _LOGGER.debug("        Adjusted type for %s to binary_sensor (read-only)", key)
+                                elif entity_type == "text" and not enable_controls:
+                                    template["type"] = "text_sensor"
+                                    _LOGGER.debug("        Adjusted type for %s to text_sensor (read-only)", key)
+                                port_templates[key] = template
+
+                            _configured_entry = {**template, "oid": port_oid}
                             flow._configured_oids["ports"][port_key][key] = _configured_entry
-                            _LOGGER.debug("        Added OID for %s in %s: %s", key, port_key, _configured_entry)
-
-                            # Add a small delay to prevent async overload with many ports
-                            await asyncio.sleep(0.01)
+                            if debug_enabled:
+                                _LOGGER.debug("        Added OID for %s in %s: %s", key, port_key, _configured_entry)
                     except Exception as e:
                         _LOGGER.error("        Error processing port %s, key %s: %s", port_key, key, e)
                         errors["base"] = "port_processing_error"
                         return flow.async_show_form(
                             step_id="settings",
-                            data_schema=vol.Schema({
-                                vol.Required(CONF_SNMP_VERSION, default=flow._data.get(CONF_SNMP_VERSION, "v2c")): vol.In(SNMP_VERSIONS),
-                                vol.Required(CONF_POLLING_INTERVAL, default=int(flow._data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL))): vol.All(vol.Coerce(int), vol.Range(min=MIN_POLLING_INTERVAL, max=MAX_POLLING_INTERVAL)),
-                                vol.Required(CONF_MAC_UPDATE_CYCLE, default=int(flow._data.get(CONF_MAC_UPDATE_CYCLE, DEFAULT_MAC_UPDATE_CYCLE))): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_MAC_UPDATE_CYCLE)),
-                                vol.Required(CONF_ENABLE_CONTROLS, default=flow._data.get(CONF_ENABLE_CONTROLS, False)): bool,
-                                vol.Optional(CONF_CUSTOM_OIDS, default=flow._data.get(CONF_CUSTOM_OIDS, "")): str,
-                            }),
+                            data_schema=_settings_schema(flow._data),
                             errors=errors
                         )
 
-            # Parse custom OIDs
-            if flow._data.get(CONF_CUSTOM_OIDS):
-                for name, oid in flow._data[CONF_CUSTOM_OIDS]:
+            # Custom OIDs (parsed once in the settings step)
+            if flow._parsed_custom_oids:
+                for name, oid in flow._parsed_custom_oids:
                     _configured_custom_entry = {
                         "oid": oid,
                         "type": "sensor",
@@ -679,13 +781,7 @@ class SnmpFlowHelper:
             errors["base"] = "parse_config_error"
             return flow.async_show_form(
                 step_id="settings",
-                data_schema=vol.Schema({
-                    vol.Required(CONF_SNMP_VERSION, default=flow._data.get(CONF_SNMP_VERSION, "v2c")): vol.In(SNMP_VERSIONS),
-                    vol.Required(CONF_POLLING_INTERVAL, default=int(flow._data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL))): vol.All(vol.Coerce(int), vol.Range(min=MIN_POLLING_INTERVAL, max=MAX_POLLING_INTERVAL)),
-                    vol.Required(CONF_MAC_UPDATE_CYCLE, default=int(flow._data.get(CONF_MAC_UPDATE_CYCLE, DEFAULT_MAC_UPDATE_CYCLE))): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_MAC_UPDATE_CYCLE)),
-                    vol.Required(CONF_ENABLE_CONTROLS, default=flow._data.get(CONF_ENABLE_CONTROLS, False)): bool,
-                    vol.Optional(CONF_CUSTOM_OIDS, default=flow._data.get(CONF_CUSTOM_OIDS, "")): str,
-                }),
+                data_schema=_settings_schema(flow._data),
                 errors=errors
             )
 
@@ -699,121 +795,118 @@ class SnmpFlowHelper:
         flow._validated_oids = {"attributes": {}, "device": {}, "ports": {}}
 
         # Prepare SNMP client
-        credentials = SnmpCredentials(
-            version=flow._data.get(CONF_SNMP_VERSION, "v2c"),
-            read_community=flow._data.get(CONF_READ_COMMUNITY_STRING, ""),
-            write_community=flow._data.get(CONF_WRITE_COMMUNITY_STRING)
-        )
-        client = await SnmpClient.create(flow._data[CONF_DEVICE_IP], credentials)
+        client = await SnmpFlowHelper.get_client(flow)
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)  # gates the per-entry debug logs
 
         # ------------------------------------------------------------------
-        # Validate attributes + device sections
+        # Collect every OID to check, in section order:
+        # (section, port_key or None, key, entry, oid, is MAC table/port OID)
         # ------------------------------------------------------------------
-        for section in ["attributes", "device"]:
-            configured_section = flow._configured_oids.get(section, {})
-            for key, entry in list(configured_section.items()):
+        checks = []
+        for section in ("attributes", "device"):
+            for key, entry in flow._configured_oids.get(section, {}).items():
                 oid = entry.get("oid", "na")
                 if oid == "na":
                     _LOGGER.debug("        Skipping OID %s in %s: marked as 'na'", key, section)
                     continue
-                # Special case: MAC OIDs → validate via helper, skip scalar GET
-                if entry.get("type") in ("mac_table", "mac_port"):
-                    if await validate_mac_oid(client, oid, key, section, _LOGGER):
-                        flow._validated_oids[section][key] = entry
-                        _LOGGER.info(        "Validated Mac Table OID for %s in %s: %s",        key, section, entry    )
+                checks.append((section, None, key, entry, oid, entry.get("type") in _MAC_TYPES))
+        validated_ports = flow._validated_oids["ports"]
+        for port_key, port_attrs in flow._configured_oids.get("ports", {}).items():
+            validated_ports[port_key] = {}
+            for key, entry in port_attrs.items():
+                oid = entry.get("oid", "na")
+                if oid == "na":
+                    if debug_enabled:
+                        _LOGGER.debug("        Skipping OID %s in %s: marked as 'na'", key, port_key)
                     continue
+                checks.append(("ports", port_key, key, entry, oid, False))
 
-                try:
-                    value = await client.async_get(oid)
-                    if value is not None and not (isinstance(value, str) and value.startswith("No Such")):
+        # ------------------------------------------------------------------
+        # Fetch concurrently (disjoint OIDs): port columns via GETBULK,
+        # attribute/device scalars via multi-varbind GETs, MAC table roots via GETNEXT
+        # ------------------------------------------------------------------
+        mac_checks = [check for check in checks if check[5]]
+        port_checks = [check for check in checks if check[1] is not None]
+        device_oids = [check[4] for check in checks if check[1] is None and not check[5]]
+        column_values, device_values, *mac_results = await asyncio.gather(
+            client.async_get_columns([check[4] for check in port_checks]),
+            client.async_get_many(device_oids),
+            *(validate_mac_oid(client, oid, key, section, _LOGGER)
+              for section, _port_key, key, _entry, oid, _is_mac in mac_checks),
+            return_exceptions=True,
+        )
+        values = {}
+        for fetched in (column_values, device_values):
+            if isinstance(fetched, BaseException):
+                _LOGGER.warning("        Failed to fetch OIDs for validation: %s", fetched)
+            else:
+                values.update(fetched)
+        mac_valid = {(check[0], check[2]) for check, ok in zip(mac_checks, mac_results) if ok is True}
+
+        # Port OIDs the bulk replies did not cover go out as multi-varbind GETs
+        missing_oids = [check[4] for check in port_checks if check[4] not in values]
+        if missing_oids:
+            try:
+                values.update(await client.async_get_many(missing_oids))
+            except Exception as e:
+                _LOGGER.warning("        Failed to fetch OIDs for validation: %s", e)
 
+        # ------------------------------------------------------------------
+        # Validate each entry against its fetched value
+        # ------------------------------------------------------------------
+        validated_flat = set()  # (section or port_key, key) of every entry that passed
+        for section, port_key, key, entry, oid, is_mac in checks:
+            where = port_key or section
+            validated = validated_ports[port_key] if port_key else flow._validated_oids[section]
+
+            # Special case: MAC OIDs → validated via helper above, no scalar GET
+            if is_mac:
+                if (section, key) in mac_valid:
+                    validated[key] = entry
+                    validated_flat.add((where, key))
+                    _LOGGER.info("Validated Mac Table OID for %s in %s: %s", key, section, entry)
+                continue
 
-                        # Case 1: calc = diff  → must be numeric
-                        if entry.get("calc") == "diff":
-                            try:
-                                float(value)
-                            except (ValueError, TypeError):
-                                _LOGGER.warning("        OID %s for %s in %s is not numeric for calc=diff", oid, key, section)
-                                continue
-                        # Case 2: math present  → must be numeric
-                        elif entry.get("math"):
-                            try:
-                                float(value)
-                            except (ValueError, TypeError):
-                                _LOGGER.warning("        OID %s for %s in %s is not numeric but math was defined", oid, key, section)
-                                continue
+            value = values.get(oid)
+            if value is None or value is NO_SUCH_OID:
+                _LOGGER.warning("        Invalid OID %s for %s in %s (value=%s)", oid, key, where, value)
+                continue
 
-                        # Case 3: vmap with numeric comparisons
-                        if "vmap" in entry:
-                            for vmap_key in entry["vmap"].keys():
-                                if vmap_key.startswith(("<", ">")):
-                                    try:
-                                        float(vmap_key[1:])
-                                    except ValueError:
-                                        _LOGGER.warning("        Invalid vmap comparison %s for %s in %s", vmap_key, key, section)
-                                        continue
-
-                        # If we reach here, OID is valid → keep it
-                        flow._validated_oids[section][key] = entry
-                        _LOGGER.debug("        Validated OID for %s in %s: %s (value=%s)", key, section, entry, value)
-                    else:
-                        _LOGGER.warning("        Invalid OID %s for %s in %s (value=%s)",oid, key, section, value)
-                except Exception as e:
-                    _LOGGER.warning("        Failed to validate OID %s for %s in %s: %s", oid, key, section, e)
+            # Read each field once; the checks below branch on the locals.
+            # vmap comparison keys need no check here: validate_vmap() already
+            # rejected malformed ones when parse_config built the entry
+            calc = entry.get("calc")
+            math = entry.get("math")
 
-        # ------------------------------------------------------------------
-        # Validate ports section
-        # ------------------------------------------------------------------
-        for port_key, port_attrs in flow._configured_oids.get("ports", {}).items():
-            flow._validated_oids["ports"][port_key] = {}
-            for key, entry in list(port_attrs.items()):
-                oid = entry.get("oid", "na")
-                if oid == "na":
-                    _LOGGER.debug("        Skipping OID %s in %s: marked as 'na'", key, port_key)
+            # Case 1: calc = diff  → must be numeric
+            if calc == "diff":
+                try:
+                    float(value)
+                except (ValueError, TypeError):
+                    _LOGGER.warning("        OID %s for %s in %s is not numeric for calc=diff", oid, key, where)
                     continue
+            # Case 2: math present (device level)  → must be numeric
+            elif port_key is None and math:
                 try:
-                    value = await client.async_get(oid)
-                    if value is not None and not (isinstance(value, str) and value.startswith("No Such")):
-                        if entry.get("calc") in ["diff"]:
-                            try:
-                                float(value)
-                            except (ValueError, TypeError):
-                                _LOGGER.warning("        Port OID %s for %s not numeric for calc=%s",
-                                                oid, key, entry.get("calc"))
-                                continue
-                        if "vmap" in entry:
-                            for vmap_key in entry["vmap"].keys():
-                                if vmap_key.startswith(("<", ">")):
-                                    try:
-                                        float(vmap_key[1:])
-                                    except ValueError:
-                                        _LOGGER.warning("        Invalid vmap comparison %s for port %s key %s",
-                                                        vmap_key, port_key, key)
-                                        continue
-                        # If valid → add to validated_oids
-                        flow._validated_oids["ports"][port_key][key] = entry
-                        _LOGGER.debug("        Validated OID for %s in %s: %s (value=%s)",
-                                    key, port_key, entry, value)
-                    else:
-                        _LOGGER.warning("        Invalid OID %s for %s in %s (value=%s)",
-                                        oid, key, port_key, value)
-                except Exception as e:
-                    _LOGGER.warning("        Failed to validate port OID %s for %s in %s: %s",
-                                    oid, key, port_key, e)
+                    float(value)
+                except (ValueError, TypeError):
+                    _LOGGER.warning("        OID %s for %s in %s is not numeric but math was defined", oid, key, where)
+                    continue
+
+            # If we reach here, OID is valid → keep it
+            validated[key] = entry
+            validated_flat.add((where, key))
+            if debug_enabled:
+                _LOGGER.debug("        Validated OID for %s in %s: %s (value=%s)", key, where, entry, value)
 
         # ------------------------------------------------------------------
         # Final summary check
         # ------------------------------------------------------------------
-        total = (
-            len(flow._validated_oids["attributes"]) +
-            len(flow._validated_oids["device"]) +
-            sum(len(p) for p in flow._validated_oids["ports"].values())
-        )
+        total = len(validated_flat)
+        attributes_total = len(flow._validated_oids["attributes"])
+        device_total = len(flow._validated_oids["device"])
         _LOGGER.info("        Validated OIDs summary: %d total (Attributes=%d, Device=%d, Ports=%d)",
-                    total,
-                    len(flow._validated_oids["attributes"]),
-                    len(flow._validated_oids["device"]),
-                    sum(len(p) for p in flow._validated_oids["ports"].values()))
+                    total, attributes_total, device_total, total - attributes_total - device_total)
 
         if total == 0:
             _LOGGER.error("        No valid OIDs found, cannot proceed")
@@ -821,14 +914,15 @@ class SnmpFlowHelper:
             return await flow.async_step_settings()
         _log_oids_pretty("info", "Validated OIDs", flow._validated_oids)
         # Warn about OIDs that were configured but did not pass validation
-        for section in ["device", "attributes"]:
-            for key in flow._configured_oids.get(section, {}):
-                if key not in flow._validated_oids.get(section, {}):
-                    _LOGGER.warning("OID configured but not validated: [%s] %s", section, key)
-        for port_key, port_attrs in flow._configured_oids.get("ports", {}).items():
-            for key in port_attrs:
-                if key not in flow._validated_oids.get("ports", {}).get(port_key, {}):
+        # (skipped outright when every check passed; each check adds at most one pair)
+        if len(validated_flat) < len(checks):
+            for section, port_key, key, *_ in checks:
+                if (port_key or section, key) in validated_flat:
+                    continue
+                if port_key:
                     _LOGGER.warning("OID configured but not validated: [%s] %s -> %s", port_key, port_key, key)
+                else:
+                    _LOGGER.warning("OID configured but not validated: [%s] %s", section, key)
 
         return await flow.async_step_present()
 
@@ -855,41 +949,39 @@ class SnmpFlowHelper:
         poe_entity_list = []
         poe_port_entities = set()
 
-        # Populate buckets
-        for section in ("device", "ports"):
-            if section == "device":
-                for key, entry in flow._validated_oids.get(section, {}).items():
-                    entity_type = entry.get("type", "sensor")
-                    name = key.replace("_", " ").title()
-                    if key.startswith("poe_"):
-                        poe_entity_list.append(f"{name} ({entity_type})")
-                    elif entity_type == "switch":
-                        switches["device"].append(name)
-                    elif entity_type == "binary_sensor":
-                        binary_sensors["device"].append(name)
-                    elif entity_type == "sensor":
-                        sensors["device"].append(name)
-                    elif entity_type == "text":
-                        texts["device"].append(name)
-                    elif entity_type == "text_sensor":
-                        text_sensors["device"].append(name)
-            else:  # ports
-                for port_key, port_attrs in flow._validated_oids.get(section, {}).items():
-                    for key, entry in port_attrs.items():
-                        entity_type = entry.get("type", "sensor")
-                        name = key.replace("port_", "").replace("_", " ").title()
-                        if key.startswith("poe_"):
-                            poe_port_entities.add(f"{name} ({entity_type})")
-                        elif entity_type == "switch":
-                            switches["ports"].add(name)
-                        elif entity_type == "binary_sensor":
-                            binary_sensors["ports"].add(name)
-                        elif entity_type == "sensor":
-                            sensors["ports"].add(name)
-                        elif entity_type == "text":
-                            texts["ports"].add(name)
-                        elif entity_type == "text_sensor":
-                            text_sensors["ports"].add(name)
+        buckets = {
+            "switch": switches,
+            "binary_sensor": binary_sensors,
+            "sensor": sensors,
+            "text": texts,
+            "text_sensor": text_sensors,
+        }
+
+        # Populate buckets; the MAC summary flag is picked up in the same pass
+        has_mac = False
+        for key, entry in flow._validated_oids.get("device", {}).items():
+            entity_type = entry.get("type", "sensor")
+            if entity_type in _MAC_TYPES:
+                has_mac = True
+                continue
+            name = key.replace("_", " ").title()
+            if key.startswith("poe_"):
+                poe_entity_list.append(f"{name} ({entity_type})")
+            elif entity_type in buckets:
+                buckets[entity_type]["device"].append(name)
+
+        # Every port repeats the same keys, so each display name is built once
+        port_names = {}
+        for port_attrs in flow._validated_oids.get("ports", {}).values():
+            for key, entry in port_attrs.items():
+                entity_type = entry.get("type", "sensor")
+                name = port_names.get(key)
+                if name is None:
+                    name = port_names[key] = key.replace("port_", "").replace("_", " ").title()
+                if key.startswith("poe_"):
+                    poe_port_entities.add(f"{name} ({entity_type})")
+                elif entity_type in buckets:
+                    buckets[entity_type]["ports"].add(name)
 
         # Device info
         device_info = flow._device_info
@@ -910,48 +1002,40 @@ class SnmpFlowHelper:
 
         # Build PoE + MAC summaries
         poe_port_count = len(poe_ports)
-        poe_entities_text = ", ".join(sorted(poe_entity_list)) if poe_entity_list else "None"
+        poe_entities_text = _join_sorted(poe_entity_list) or "None"
         device_poe_text = f"PoE Port Count: {poe_port_count}, PoE Budget: {poe_budget}, Entities: {poe_entities_text}"
 
         poe_port_entities_text = (
             f"PoE Port Entities: {poe_port_count} ports - "
-            f"{', '.join(sorted(poe_port_entities)) if poe_port_entities else 'None'}"
+            f"{_join_sorted(poe_port_entities) or 'None'}"
         )
 
-        has_mac = any(e.get("type") in ("mac_table", "mac_port") for e in flow._validated_oids.get("device", {}).values())
         mac_text = f"MAC Table + {flow._device_info.get('port_count', 0)} port switches" if has_mac else "None"
 
         # Build schema dynamically in correct order
         schema_dict = {}
-        schema_dict[vol.Optional(CONF_DEVICE_INFO, default=device_info_text)] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-
-        if sensors["device"]:
-            schema_dict[vol.Optional("device_sensors", default=", ".join(sorted(sensors["device"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if binary_sensors["device"]:
-            schema_dict[vol.Optional("device_binary_sensors", default=", ".join(sorted(binary_sensors["device"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if switches["device"]:
-            schema_dict[vol.Optional("device_switches", default=", ".join(sorted(switches["device"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if texts["device"]:
-            schema_dict[vol.Optional("device_texts", default=", ".join(sorted(texts["device"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if text_sensors["device"]:
-            schema_dict[vol.Optional("device_text_sensors", default=", ".join(sorted(text_sensors["device"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-
-        if sensors["ports"]:
-            schema_dict[vol.Optional("per_port_sensors", default=", ".join(sorted(sensors["ports"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if binary_sensors["ports"]:
-            schema_dict[vol.Optional("per_port_binary_sensors", default=", ".join(sorted(binary_sensors["ports"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if switches["ports"]:
-            schema_dict[vol.Optional("per_port_switches", default=", ".join(sorted(switches["ports"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if texts["ports"]:
-            schema_dict[vol.Optional("per_port_texts", default=", ".join(sorted(texts["ports"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        if text_sensors["ports"]:
-            schema_dict[vol.Optional("per_port_text_sensors", default=", ".join(sorted(text_sensors["ports"])))] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-
-        schema_dict[vol.Optional("device_poe", default=device_poe_text)] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-        schema_dict[vol.Optional("poe_port_entities", default=poe_port_entities_text)] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
-
-
-        schema_dict[vol.Optional("device_mac", default=f"MAC Entities: {mac_text}")] = selector.TextSelector(selector.TextSelectorConfig(multiline=False))
+        schema_dict[vol.Optional(CONF_DEVICE_INFO, default=device_info_text)] = _TEXT_SELECTOR
+
+        for field, names in (
+            ("device_sensors", sensors["device"]),
+            ("device_binary_sensors", binary_sensors["device"]),
+            ("device_switches", switches["device"]),
+            ("device_texts", texts["device"]),
+            ("device_text_sensors", text_sensors["device"]),
+            ("per_port_sensors", sensors["ports"]),
+            ("per_port_binary_sensors", binary_sensors["ports"]),
+            ("per_port_switches", switches["ports"]),
+            ("per_port_texts", texts["ports"]),
+            ("per_port_text_sensors", text_sensors["ports"]),
+        ):
+            if names:
+                schema_dict[vol.Optional(field, default=_join_sorted(names))] = _TEXT_SELECTOR
+
+        schema_dict[vol.Optional("device_poe", default=device_poe_text)] = _TEXT_SELECTOR
+        schema_dict[vol.Optional("poe_port_entities", default=poe_port_entities_text)] = _TEXT_SELECTOR
+
+
+        schema_dict[vol.Optional("device_mac", default=f"MAC Entities: {mac_text}")] = _TEXT_SELECTOR
 
         schema_dict[vol.Required(CONF_CONFIRM, default=True)] = bool
 
@@ -972,24 +1056,31 @@ class SnmpFlowHelper:
         device_registry = async_get_device_registry(flow.hass)
 
         config_entry_id = getattr(flow, "_entry_id", None) if flow._is_reconfigure else None
-        device_ip = flow._data[CONF_DEVICE_IP]
-        entities_to_delete = []
-
-        # Collect entity IDs to delete
-        for entity_id, entity in entity_registry.entities.items():
-            if config_entry_id and entity.config_entry_id == config_entry_id:
-                entities_to_delete.append(entity_id)
-            elif entity.device_id:
-                device = device_registry.async_get(entity.device_id)
-                if device and (DOMAIN, device_ip) in device.identifiers:
-                    entities_to_delete.append(entity_id)
-
-        # Remove entities
-        for entity_id in entities_to_delete:
-            entity_registry.async_remove(entity_id)
+        target_ident = (DOMAIN, flow._data[CONF_DEVICE_IP])
+
+        # Collect entity IDs to delete through the registries' config entry and
+        # device indexes instead of scanning every entity in Home Assistant
+        # (dict keys drop entities matched by both)
+        to_delete = {}
+        if config_entry_id:
+            for entity in er.async_entries_for_config_entry(entity_registry, config_entry_id):
+                to_delete[entity.entity_id] = None
+        device = device_registry.async_get_device(identifiers={target_ident})
+        if device:
+            for entity in er.async_entries_for_device(entity_registry, device.id, include_disabled_entities=True):
+                to_delete[entity.entity_id] = None
+        entities_to_delete = list(to_delete)
+
+        # Remove entities in chunks, yielding between them so a large reconfigure does
+        # not hold the event loop (registry persistence is already debounced by HA)
+        for start in range(0, len(entities_to_delete), _ENTITY_REMOVAL_CHUNK):
+            for entity_id in entities_to_delete[start:start + _ENTITY_REMOVAL_CHUNK]:
+                entity_registry.async_remove(entity_id)
+            await asyncio.sleep(0)  # let removals flush
         _LOGGER.info("        Step finish queued %d entities for removal", len(entities_to_delete))
 
-        await asyncio.sleep(0)  # let removals flush
+        # The flow's SNMP client is no longer needed; the coordinator creates its own
+        SnmpFlowHelper.release_client(flow)
 
         # Save validated OIDs & device info
         flow._data[CONF_VALIDATED_OIDS] = flow._validated_oids
@@ -1015,20 +1106,43 @@ class SnmpFlowHelper:
     def create_client_params(flow):
         """Create client credentials for SNMP client."""
         _LOGGER.info("# Entering create_client_params")
+        data = flow._data
         credentials = SnmpCredentials(
-            version=flow._data.get(CONF_SNMP_VERSION, "v2c"),
-            read_community=flow._data.get(CONF_READ_COMMUNITY_STRING, ""),
-            write_community=flow._data.get(CONF_WRITE_COMMUNITY_STRING),
-            username=flow._data.get(CONF_USERNAME),
-            auth_protocol=flow._data.get(CONF_AUTH_PROTOCOL),
-            auth_key=flow._data.get(CONF_AUTH_KEY),
-            privacy_protocol=flow._data.get(CONF_PRIVACY_PROTOCOL),
-            privacy_key=flow._data.get(CONF_PRIVACY_KEY)
+            version=data.get(CONF_SNMP_VERSION, "v2c"),
+            read_community=data.get(CONF_READ_COMMUNITY_STRING, ""),
+            write_community=data.get(CONF_WRITE_COMMUNITY_STRING),
+            username=data.get(CONF_USERNAME),
+            auth_protocol=data.get(CONF_AUTH_PROTOCOL),
+            auth_key=data.get(CONF_AUTH_KEY),
+            privacy_protocol=data.get(CONF_PRIVACY_PROTOCOL),
+            privacy_key=data.get(CONF_PRIVACY_KEY)
         )
         _LOGGER.debug("        Step create_client_params created credentials: version=%s, read_community=%s, write_community=%s",
                     credentials.version, credentials.read_community, credentials.write_community)
         return credentials
 
+    @staticmethod
+    async def get_client(flow):
+        """Return the flow's SNMP client, creating it only when host or credentials changed.
+
+        The client is shared by the test, discover and validate steps.
+        """
+        host = flow._data[CONF_DEVICE_IP]
+        credentials = SnmpFlowHelper.create_client_params(flow)
+        client = flow._snmp_client
+        if client is None or client.host != host or client.credentials != credentials:
+            SnmpFlowHelper.release_client(flow)  # host or credentials changed: drop the old one
+            client = flow._snmp_client = await SnmpClient.create(host, credentials)
+            _LOGGER.debug("        Created SNMP client for %s", host)
+        return client
+
+    @staticmethod
+    def release_client(flow):
+        """Release the flow's SNMP client, if it holds one."""
+        client, flow._snmp_client = flow._snmp_client, None
+        if client is not None:
+            client.release()
+
 
 
 class SnmpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -1045,6 +1159,13 @@ class SnmpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._device_info = {}
         self._firmware_value = "Unknown"
         self._is_reconfigure = False
+        self._snmp_client = None  # Reused across test/discover/validate steps
+        self._parsed_custom_oids = []  # [(name, oid)] from the settings step
+
+    @callback
+    def async_remove(self):
+        """Release the SNMP client when the flow finishes, fails or is aborted."""
+        SnmpFlowHelper.release_client(self)
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step for basic device info."""
@@ -1052,7 +1173,7 @@ class SnmpFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             try:
-                ipaddress.ip_address(user_input[CONF_DEVICE_IP])
+                validate_ip_address(user_input[CONF_DEVICE_IP])
                 self._data.update(user_input)
                 _LOGGER.debug("User step data: %s", self._data)
                 _LOGGER.info("Basic device info validated, proceeding to settings step")
@@ -1142,9 +1263,16 @@ class SnmpOptionsFlow(config_entries.OptionsFlow):
         self._validated_oids = {}
         self._device_info = {}
         self._firmware_value = "Unknown"
+        self._snmp_client = None  # Reused across test/discover/validate steps
+        self._parsed_custom_oids = []  # [(name, oid)] from the settings step
         self._device_name = config_entry.data.get(CONF_DEVICE_NAME, "this device")
         self._config_data = dict(config_entry.data)
 
+    @callback
+    def async_remove(self):
+        """Release the SNMP client when the flow finishes, fails or is aborted."""
+        SnmpFlowHelper.release_client(self)
+
 
     async def async_step_init(self, user_input=None):
         """Handle the initial step when clicking 'Configure'."""
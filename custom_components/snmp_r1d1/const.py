@@ -1,7 +1,5 @@
 """Constants for snmp_r1d1 integration."""
 
-from .device_loader import load_devices
-
 DOMAIN = "snmp_r1d1"
 
 # Polling Settings
@@ -43,6 +41,4 @@ CONF_DEVICE_INFO = "device_info"
 CONF_CONFIG_SUMMARY = "config_summary"
 CONF_GO_BACK = "go_back"
 CONF_CONFIRM = "confirm"
-CONF_ENTITIES = "entities"
-
-DEVICE_TYPE_OIDS = load_devices()
\ No newline at end of file
+CONF_ENTITIES = "entities"
\ No newline at end of file
@@ -1,20 +1,50 @@
 """Data coordinator for snmp_r1d1 integration."""
 
 import asyncio
-import copy
+import random
+import sys
+import time
 from datetime import timedelta
+from functools import cached_property
+from types import MappingProxyType
 from homeassistant.util import dt as dt_util
 import logging
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import async_get as async_get_dr
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .const import *
-from .snmp import SnmpClient, SnmpCredentials
+from .snmp import NO_SUCH_OID, SnmpClient, SnmpCredentials
 from .helpers import to_snmp_bool
 
 # Setup logger for this module
 _LOGGER = logging.getLogger(__name__)
 
+# Device entries holding MAC table roots (walked, never fetched with a scalar GET)
+_MAC_TYPES = frozenset(("mac_table", "mac_port"))
+
+# Backoff (seconds) for OIDs the agent reports as noSuchObject/noSuchInstance:
+# doubles per consecutive miss, capped, plus up to 10% jitter
+_BACKOFF_BASE = 60
+_BACKOFF_MAX = 3600
+
+# sysUpTime.0: while it keeps growing the device has not rebooted (or been reflashed)
+_SYS_UPTIME_OID = "1.3.6.1.2.1.1.3.0"
+
+# Slow cycles between firmware re-reads on a device that has not rebooted
+_FIRMWARE_REFRESH_CYCLES = 6
+
+# Two-digit hex for each octet value, for building MAC strings from OID suffixes
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+# Marks a key absent from one side of a diff (distinct from a stored None)
+_MISSING = object()
+
+
+def _canonical_oid(oid):
+    """Profiles mix ".1.3..." and "1.3...": strip the leading dot once and intern the result."""
+    return sys.intern(oid.lstrip(".")) if oid else None
+
 
 class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
     """Manages SNMP polling, caching and write operations for this integration."""
@@ -33,20 +63,117 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
         # Pre-validated OIDs passed from config flow (structure: device, ports, attributes, etc.)
         self.validated_oids = config_entry.data[CONF_VALIDATED_OIDS]
 
+        # Poll layout flattened once (validated_oids does not change while the entry is loaded)
+        device_oids = self.validated_oids.get("device", {})
+        # firmware is handled separately in the slow cycle; MAC table/port OIDs are
+        # table roots walked by the MAC cycle, a scalar GET on them only returns noSuchObject
+        # Keys are interned so every port dict, listener key and snapshot shares one string object;
+        # OIDs are canonicalized the same way, as they key the reply dicts and the backoff table
+        self._device_polls = [
+            (sys.intern(key), _canonical_oid(entry["oid"]))
+            for key, entry in device_oids.items()
+            if key != "firmware" and entry.get("oid") and entry.get("type") not in _MAC_TYPES
+        ]
+        self._device_poll_oids = [oid for _, oid in self._device_polls]
+        firmware_entry = self.validated_oids.get("attributes", {}).get("firmware") or device_oids.get("firmware")
+        self._firmware_oid = _canonical_oid(firmware_entry.get("oid")) if firmware_entry else None
+        self._mac_table_oid = self._mac_port_oid = None
+        for entry in device_oids.values():
+            if entry.get("type") == "mac_table":
+                self._mac_table_oid = _canonical_oid(entry.get("oid"))
+            elif entry.get("type") == "mac_port":
+                self._mac_port_oid = _canonical_oid(entry.get("oid"))
+        self._port_polls = [
+            (port_key, sys.intern(key), _canonical_oid(entry["oid"]))
+            for port_key, port_attrs in self.validated_oids.get("ports", {}).items()
+            for key, entry in port_attrs.items()
+            if entry.get("oid")
+        ]
+        self._port_poll_oids = [oid for _, _, oid in self._port_polls]
+        # Column GETBULKs for the port OIDs, planned once instead of re-parsing every OID per cycle
+        self._port_column_plan = SnmpClient.plan_columns(self._port_poll_oids)
+        # Counters reported as per-second rates (calc "diff"): (section, key) with section "device" or a port key
+        self._diff_polls = [("device", key) for key, entry in device_oids.items() if entry.get("calc") == "diff"] + [
+            (port_key, key)
+            for port_key, port_attrs in self.validated_oids.get("ports", {}).items()
+            for key, entry in port_attrs.items()
+            if entry.get("calc") == "diff"
+        ]
+        # Device key polled from sysUpTime, if any (lets the firmware read be skipped between reboots)
+        self._uptime_key = next(
+            (key for key, oid in self._device_polls if oid == _SYS_UPTIME_OID), None
+        )
+
+        # Device registry metadata, built once and shared by reference with every entity.
+        # Read-only so no entity can mutate the instance all the others share.
+        device_info_data = config_entry.data.get(CONF_DEVICE_INFO, {})
+        self.device_info = MappingProxyType(DeviceInfo(
+            identifiers={(DOMAIN, config_entry.data[CONF_DEVICE_IP])},
+            name=config_entry.data[CONF_DEVICE_NAME],
+            manufacturer=device_info_data.get("manufacturer", "Unknown"),
+            model=device_info_data.get("model", "Unknown"),
+        ))
+
+        # Stable per-section value dicts, refreshed in place on every poll.
+        # Entities bind a read-only view once instead of re-walking coordinator.data per state read.
+        self._device_data = {}
+        self._port_data = {port_key: {} for port_key in self.validated_oids.get("ports", {})}
+        self.device_view = MappingProxyType(self._device_data)
+
+        # Port keys ("p01", "p02", ...) sorted numerically once, shared by all platform setups
+        self._port_key_num = {port_key: int(port_key[1:]) for port_key in self._port_data}
+        self._sorted_port_keys = sorted(self._port_key_num, key=self._port_key_num.__getitem__)
+        # Port keys within the device's port_count (validated_oids may hold more, e.g. after a model change)
+        port_count = int(device_info_data.get("port_count", 1))
+        self._port_keys_under_limit = tuple(
+            port_key for port_key in self._sorted_port_keys if self._port_key_num[port_key] <= port_count
+        )
+        if len(self._port_keys_under_limit) < len(self._sorted_port_keys):
+            _LOGGER.debug(
+                "Ignoring %d port keys above port_count %d",
+                len(self._sorted_port_keys) - len(self._port_keys_under_limit), port_count,
+            )
+
+        # Key-scoped listeners {(section, key): [callback]} where section is "device" or a port key,
+        # plus the (section, key) pairs changed by the last poll. Entities subscribe to the values
+        # they render so unchanged entities are not re-written on every poll.
+        self._key_listeners = {}
+        self._changed_keys = set()
+
+        # Diff counters as flat arrays aligned with _diff_polls: where each value lives (the stable
+        # section dict and key), its float value at the last poll and its per-second rate, plus
+        # the index of each (section, key) and the wall-clock time of the last rate computation
+        self._diff_sources = [
+            (self._device_data if section == "device" else self._port_data[section], key)
+            for section, key in self._diff_polls
+        ]
+        self._diff_index = {pair: index for index, pair in enumerate(self._diff_polls)}
+        self._counter_prev = [None] * len(self._diff_polls)
+        self._counter_rates = [None] * len(self._diff_polls)
+        self._rates_time = None
+
         # Coordinator's internal data cache
         # Always a dictionary → avoids NoneType errors when entities access coordinator.data
-        self.data = {"previous": {}, "last_updated": {}}
+        self.data = {"last_updated": {}}
 
         # Cache for firmware polling to avoid frequent repeated SNMP queries
         self._firmware_cache = "Unknown"
+        self._firmware_uptime = None  # sysUpTime seen when the firmware was last read
+        self._firmware_skips = 0      # Slow cycles skipped since then
+        self._firmware_candidate = None  # Changed firmware value not yet confirmed by a second read
 
-        # Track timestamps for last "slow update" and last MAC table refresh
-        self._last_slow_update = 0
-        self._last_mac_update = 0
+        # Track monotonic times of last "slow update" and last MAC table refresh
+        # (-inf so the first poll always runs both, however early after boot it happens)
+        self._last_slow_update = float("-inf")
+        self._last_mac_update = float("-inf")
+
+        # OIDs the agent does not implement: {oid: (skip_until_monotonic, consecutive_misses)}
+        self._oid_backoff = {}
 
         # Control flags and lock for concurrency
         self._aborted = False               # Used to abort polling if entry is being removed
-        self._lock = asyncio.Lock()         # Prevents concurrent SNMP calls overlapping
+        self._poll_tasks = ()               # Poll subtasks of the cycle in flight (see async_abort)
+        self._lock = asyncio.Lock()         # Serializes SNMP SETs; polling reads are capped by the client instead
 
         # Polling interval defined in config
         poll_interval = config_entry.data.get(CONF_POLLING_INTERVAL)
@@ -60,6 +187,135 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=poll_interval),
         )
 
+    # ------------------------------------------------------------------
+    # Validated OIDs bucketed by entity type
+    # ------------------------------------------------------------------
+    @cached_property
+    def oids_by_type(self):
+        """Partition validated OIDs by entity type, built once and shared by all platforms.
+
+        Structure:
+            {"<type>": {"device": [(key, entry), ...], "ports": {"p01": [(key, entry), ...]}}}
+        """
+        index = {}
+        for key, entry in self.validated_oids.get("device", {}).items():
+            bucket = index.setdefault(entry.get("type", "sensor"), {"device": [], "ports": {}})
+            bucket["device"].append((key, entry))
+        for port_key, port_attrs in self.validated_oids.get("ports", {}).items():
+            for key, entry in port_attrs.items():
+                bucket = index.setdefault(entry.get("type", "sensor"), {"device": [], "ports": {}})
+                bucket["ports"].setdefault(port_key, []).append((key, entry))
+        return index
+
+    def oids_for_type(self, entity_type: str):
+        """Return the device/port buckets for one entity type (empty buckets if none)."""
+        return self.oids_by_type.get(entity_type, {"device": [], "ports": {}})
+
+    @property
+    def port_keys(self):
+        """Port keys ("p01", ...) within port_count, sorted numerically (read-only tuple)."""
+        return self._port_keys_under_limit
+
+    def port_view(self, port_key: str):
+        """Return a read-only view of one port's values (kept current across polls)."""
+        return MappingProxyType(self._port_data.setdefault(port_key, {}))
+
+    # ------------------------------------------------------------------
+    # Key-scoped listeners
+    # ------------------------------------------------------------------
+    @callback
+    def async_add_key_listener(self, section: str, keys, update_callback):
+        """Listen for changes to the given keys of one section ("device" or a port key).
+
+        Returns a callable that removes the listener.
+        """
+        buckets = [self._key_listeners.setdefault((section, key), []) for key in keys]
+        for listeners in buckets:
+            listeners.append(update_callback)
+        # Keep a regular (no-op) listener registered so HA keeps scheduling refreshes
+        remove_refresh_listener = self.async_add_listener(lambda: None)
+
+        @callback
+        def remove_listener():
+            for listeners in buckets:
+                listeners.remove(update_callback)
+            remove_refresh_listener()
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self):
+        """Update all regular listeners, then only the key listeners whose value changed."""
+        super().async_update_listeners()
+        changed, self._changed_keys = self._changed_keys, set()
+        key_listeners = self._key_listeners
+        # An entity listening to several changed keys is only written once
+        pending = {}
+        for changed_key in changed:
+            for update_callback in key_listeners.get(changed_key, ()):
+                pending[update_callback] = None
+        for update_callback in pending:
+            update_callback()
+
+    @staticmethod
+    def _diff_keys(section: str, old: dict, new: dict):
+        """Return the (section, key) pairs whose value differs between old and new."""
+        return {
+            (section, key)
+            for key in old.keys() | new.keys()
+            if old.get(key, _MISSING) != new.get(key, _MISSING)
+        }
+
+    def _apply_section(self, section: str, stored: dict, polled: dict):
+        """Write only the changed keys of one section into its stable dict and record them."""
+        changed = self._diff_keys(section, stored, polled)
+        for _section, key in changed:
+            value = polled.get(key, _MISSING)
+            if value is _MISSING:
+                del stored[key]
+            else:
+                stored[key] = value
+        self._changed_keys |= changed
+
+    # ------------------------------------------------------------------
+    # Counter rates (calc "diff")
+    # ------------------------------------------------------------------
+    def counter_rate(self, section: str, key: str):
+        """Return the per-second rate of a diff counter from the last poll (None if unknown)."""
+        index = self._diff_index.get((section, key))
+        return None if index is None else self._counter_rates[index]
+
+    def _update_rates(self, current_time: float):
+        """Recompute every diff counter's rate against the previous poll, in one pass."""
+        elapsed = current_time - self._rates_time if self._rates_time is not None else 0
+        self._rates_time = current_time
+        prev_values = self._counter_prev
+        rates = self._counter_rates
+        for index, (values, key) in enumerate(self._diff_sources):
+            # Each value is parsed once; it is the previous value for the next poll
+            try:
+                current = float(values.get(key))
+            except (TypeError, ValueError):
+                current = None  # an error/missing marker: no rate now or next cycle
+            prev = prev_values[index]
+            prev_values[index] = current
+            rates[index] = None
+            if elapsed <= 0 or current is None or prev is None:
+                continue  # no history yet
+            delta = current - prev
+            if delta >= 0:  # a negative delta is a counter reset: no rate this cycle
+                rates[index] = round(delta / elapsed, 2)
+
+    # ------------------------------------------------------------------
+    # Teardown: abort polling
+    # ------------------------------------------------------------------
+    @callback
+    def async_abort(self):
+        """Stop polling: no new cycles start and the SNMP requests in flight are cancelled."""
+        self._aborted = True
+        for task in self._poll_tasks:
+            task.cancel()
+
     # ------------------------------------------------------------------
     # Credentials factory
     # ------------------------------------------------------------------
@@ -77,6 +333,27 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
             privacy_key=data.get(CONF_PRIVACY_KEY)
         )
 
+    # ------------------------------------------------------------------
+    # Write helper: cache a value confirmed by a successful SET
+    # ------------------------------------------------------------------
+    def _store(self, level, key, port, value, current_time):
+        """Store a written value in the stable device/port dicts and stamp its section.
+
+        Key listeners on the written key are called right away: the next poll will
+        read the same value back, so its diff would never report this key as changed.
+        """
+        last_updated = self.data.setdefault("last_updated", {})
+        if level == "device":
+            section = "device"
+            self._device_data[key] = value
+            last_updated["device"] = current_time
+        else:
+            section = port
+            self._port_data.setdefault(port, {})[key] = value
+            last_updated.setdefault("ports", {})[port] = current_time
+        for update_callback in tuple(self._key_listeners.get((section, key), ())):
+            update_callback()
+
     # ------------------------------------------------------------------
     # Write operation: set switch state
     # ------------------------------------------------------------------
@@ -103,12 +380,10 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
         if level == "device":
             entry = self.validated_oids.get("device", {}).get(key, {})
             oid = entry.get("oid")
-            section = "device"
             identifier = key
         else:
             entry = self.validated_oids.get("ports", {}).get(port, {}).get(key, {})
             oid = entry.get("oid")
-            section = "ports"
             identifier = f"port_{port}_{key}"
         
         # If no OID, cannot perform write
@@ -125,7 +400,8 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
         # Perform SNMP SET operation
         _LOGGER.debug("Setting %s %s to %s with OID %s", level, identifier, 'on' if state else 'off', oid)
         try:
-            result = await self.client.async_set(oid, value, value_type="integer")
+            async with self._lock:
+                result = await self.client.async_set(oid, value, value_type="integer")
         except Exception as e:
             _LOGGER.error("SNMP set failed for %s %s (OID=%s, value=%s): %s",
                           level, identifier, oid, value, e)
@@ -135,24 +411,7 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
         if result:
             _LOGGER.info("Successfully set %s %s to %s", level, identifier, 'on' if state else 'off')
 
-            # Ensure section exists
-            if section not in self.data:
-                self.data[section] = {}
-
-            # Ensure port dict exists if writing port-level
-            if level == "port" and port not in self.data[section]:
-                self.data[section][port] = {}
-
-            # Store the value in cache
-            if level == "device":
-                self.data["device"][key] = value
-            else:
-                self.data["ports"].setdefault(port, {})
-                self.data["ports"][port][key] = value
-
-            # Mark last updated timestamp
-            self.data.setdefault("last_updated", {})
-            self.data["last_updated"][identifier] = current_time
+            self._store(level, key, port, value, current_time)
         else:
             _LOGGER.error("Failed to set %s %s state", level, identifier)
 
@@ -185,12 +444,10 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
         if level == "device":
             entry = self.validated_oids.get("device", {}).get(key, {})
             oid = entry.get("oid")
-            section = "device"
             identifier = key
         else:
             entry = self.validated_oids.get("ports", {}).get(port, {}).get(key, {})
             oid = entry.get("oid")
-            section = "ports"
             identifier = f"port_{port}_{key}"
         
         # Guard: no OID means invalid config
@@ -202,7 +459,8 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Perform SNMP SET (string type)
         try:
-            result = await self.client.async_set(oid, value, value_type="string")
+            async with self._lock:
+                result = await self.client.async_set(oid, value, value_type="string")
         except Exception as e:
             _LOGGER.error("SNMP set failed for %s %s (OID=%s, value=%s): %s",
                           level, identifier, oid, value, e)
@@ -211,22 +469,237 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
         # Update local cache if successful
         if result:
             _LOGGER.info("Successfully set %s %s to %s", level, identifier, value)
-            if section not in self.data:
-                self.data[section] = {}
-            if level == "port" and port not in self.data[section]:
-                self.data[section][port] = {}
-            if level == "device":
-                self.data["device"][key] = value
-            else:
-                self.data["ports"].setdefault(port, {})
-                self.data["ports"][port][key] = value
-            self.data.setdefault("last_updated", {})
-            self.data["last_updated"][identifier] = current_time
+            self._store(level, key, port, value, current_time)
         else:
             _LOGGER.error("Failed to set %s %s to %s", level, identifier, value)
 
         return result
 
+    # ------------------------------------------------------------------
+    # Backoff for OIDs the agent does not implement
+    # ------------------------------------------------------------------
+    def _backed_off_oids(self, now):
+        """Return the OIDs to leave out of this cycle's requests."""
+        return {oid for oid, (skip_until, _misses) in self._oid_backoff.items() if skip_until > now}
+
+    def _oid_missed(self, oid, now):
+        """Record a noSuch* reply for oid and push its next poll back exponentially."""
+        misses = self._oid_backoff.get(oid, (0, 0))[1]
+        delay = min(_BACKOFF_BASE * 2 ** misses, _BACKOFF_MAX)
+        self._oid_backoff[oid] = (now + delay + random.uniform(0, 0.1 * delay), misses + 1)
+        _LOGGER.debug("OID %s not implemented by agent, skipping it for %ds", oid, delay)
+
+    # ------------------------------------------------------------------
+    # Polling helpers: each fills its own part of new_data
+    # ------------------------------------------------------------------
+    async def _poll_device(self, new_data, current_time, now):
+        """Poll device-level OIDs with one batched GET."""
+        device_oids = self._device_poll_oids
+        skipped = self._backed_off_oids(now) if self._oid_backoff else ()
+        if skipped:
+            device_oids = [oid for oid in device_oids if oid not in skipped]
+        # One batched GET for all device OIDs instead of one round-trip each
+        try:
+            device_values = await self.client.async_get_many(device_oids)
+        except Exception as e:
+            _LOGGER.error(f"Failed to fetch device OIDs: {e}")
+            device_values = None
+        for key, oid in self._device_polls:
+            if oid in skipped:
+                new_data["device"][key] = "missing"
+                continue
+            if device_values is None:
+                new_data["device"][key] = "error"
+            else:
+                value = device_values.get(oid)
+                if value and value is not NO_SUCH_OID:
+                    new_data["device"][key] = value
+                    self._oid_backoff.pop(oid, None)
+                else:
+                    new_data["device"][key] = "missing"
+                    _LOGGER.debug(f"Set fallback for device {key}: missing, value={value}")
+                    # Only an explicit noSuch* reply backs off; a timeout (None) is retried next cycle
+                    if value is NO_SUCH_OID:
+                        self._oid_missed(oid, now)
+
+    async def _poll_firmware(self, new_data, current_time, now, device_task):
+        """Poll the firmware OID (slow cycle) and push changes to the device registry."""
+        slow_interval = SLOW_UPDATE_CYCLE * self.config_entry.data[CONF_POLLING_INTERVAL]
+        if now - self._last_slow_update >= slow_interval:
+            firmware_oid = self._firmware_oid
+            if self._uptime_key is not None:
+                # The reboot check needs this cycle's sysUpTime, not the one stored last cycle.
+                # wait() does not raise: a failed device poll is reported by the TaskGroup.
+                await asyncio.wait((device_task,))
+            uptime = self._read_uptime(new_data["device"])
+            if (
+                firmware_oid
+                and self._firmware_cache != "Unknown"
+                and uptime is not None
+                and self._firmware_uptime is not None
+                and uptime >= self._firmware_uptime
+                and self._firmware_candidate is None
+                and self._firmware_skips < _FIRMWARE_REFRESH_CYCLES - 1
+            ):
+                # No reboot since the last read, so the firmware cannot have changed
+                self._firmware_skips += 1
+                _LOGGER.debug("Skipping firmware poll, device has not rebooted (uptime %s)", uptime)
+            elif firmware_oid:
+                self._firmware_uptime = uptime
+                self._firmware_skips = 0
+                _LOGGER.debug(f"Polling firmware OID: {firmware_oid}")
+                value = await self.client.async_get(firmware_oid)
+                if value and value is not NO_SUCH_OID:
+                    # A new value must be read on two slow cycles in a row before it is stored,
+                    # so a flapping string does not rewrite the config entry every cycle
+                    if value == self._firmware_cache:
+                        self._firmware_candidate = None
+                    elif self._firmware_cache != "Unknown" and value != self._firmware_candidate:
+                        self._firmware_candidate = value
+                        _LOGGER.debug("Firmware changed to %s, waiting for it to repeat", value)
+                    else:
+                        self._firmware_candidate = None
+                        self._firmware_cache = value
+                        # Update config entry and HA device registry, unless they already hold
+                        # this value (first read after a restart)
+                        device_info = self.config_entry.data.get(CONF_DEVICE_INFO, {})
+                        if device_info.get("firmware") != value:
+                            new_device_info = dict(device_info)
+                            new_device_info["firmware"] = value
+                            self.hass.config_entries.async_update_entry(
+                                self.config_entry,
+                                data={**self.config_entry.data, CONF_DEVICE_INFO: new_device_info}
+                            )
+                            device_registry = async_get_dr(self.hass)
+                            device_entry_data = {
+                                "identifiers": {(DOMAIN, self.config_entry.data[CONF_DEVICE_IP])},
+                                "manufacturer": new_device_info.get("manufacturer", "Unknown"),
+                                "model": new_device_info.get("model", "Unknown"),
+                                "name": self.config_entry.data[CONF_DEVICE_NAME],
+                                "sw_version": value,
+                                "serial_number": new_device_info.get("serial", None),
+                                "connections": {("ip", self.config_entry.data[CONF_DEVICE_IP])},
+                            }
+                            device_registry.async_get_or_create(
+                                config_entry_id=self.config_entry.entry_id,
+                                **device_entry_data
+                            )
+                    new_data["last_updated"]["firmware"] = current_time
+                else:
+                    # Keep the last good value ("Unknown" only until the first read succeeds), so a
+                    # timeout cannot make the next read look like a first read and bypass the debounce;
+                    # forgetting the uptime makes the next slow cycle read again instead of skipping
+                    self._firmware_uptime = None
+                    _LOGGER.debug("Firmware read failed (%s), keeping %s", value, self._firmware_cache)
+            self._last_slow_update = now
+        new_data["device"]["firmware"] = self._firmware_cache
+
+    def _read_uptime(self, device_values):
+        """Return sysUpTime in ticks from polled device values, or None if not polled/not numeric."""
+        if self._uptime_key is None:
+            return None
+        try:
+            return int(device_values.get(self._uptime_key))
+        except (TypeError, ValueError):
+            return None
+
+    async def _poll_ports(self, new_data, current_time, now):
+        """Poll port-level OIDs, column GETBULKs first and batched GETs for the rest."""
+        port_results = new_data["ports"]
+        for port_key in self._port_data:
+            port_results[port_key] = {}
+        # Port OIDs are <column>.<port>: one GETBULK per column covers every port,
+        # whatever it did not cover goes out in batched GETs, chunked by the client
+        port_oids = self._port_poll_oids
+        column_plan = self._port_column_plan
+        skipped = self._backed_off_oids(now) if self._oid_backoff else ()
+        if skipped:
+            port_oids = [oid for oid in port_oids if oid not in skipped]
+            column_plan = None  # re-planned by the client for the reduced OID list
+        try:
+            port_values = await self.client.async_get_columns(port_oids, plan=column_plan)
+            missing_oids = [oid for oid in port_oids if oid not in port_values]
+            if missing_oids:
+                port_values.update(await self.client.async_get_many(missing_oids))
+        except Exception as e:
+            _LOGGER.error(f"Failed to fetch port OIDs: {e}")
+            port_values = None
+        for port_key, key, oid in self._port_polls:
+            if oid in skipped:
+                # Backed off: same marker as a backed-off device OID, so the key is kept, not dropped
+                port_results[port_key][key] = "missing"
+                continue
+            if port_values is None:
+                port_results[port_key][key] = "error"
+            else:
+                value = port_values.get(oid)
+                if value is not NO_SUCH_OID:
+                    port_results[port_key][key] = value
+                    if value is not None:
+                        self._oid_backoff.pop(oid, None)
+                else:
+                    _LOGGER.warning(f"Skipping port {port_key} {key} due to invalid response: {value}")
+                    self._oid_missed(oid, now)
+        new_data["last_updated"]["ports"] = dict.fromkeys(port_results, current_time)
+
+    async def _poll_mac_table(self, new_data, current_time, now):
+        """Walk the MAC table (every CONF_MAC_UPDATE_CYCLE polls) and group MACs by port."""
+        mac_interval = self.config_entry.data[CONF_MAC_UPDATE_CYCLE] * self.config_entry.data[CONF_POLLING_INTERVAL]
+        if now - self._last_mac_update < mac_interval:
+            return
+        mac_table_oid = self._mac_table_oid
+        mac_port_oid = self._mac_port_oid
+        excluded_ports = set(self.config_entry.options.get("mac_excluded_ports", []))
+        if mac_table_oid and mac_port_oid:
+            # Fetch raw SNMP data (both walks at once)
+            macs, ports = await asyncio.gather(
+                self.client.async_get_subtree(mac_table_oid),
+                self.client.async_get_subtree(mac_port_oid),
+            )
+            if macs and ports:
+                # Prefixes and their lengths are built once per walk, not per row. The walks
+                # run with lexicographicMode=False, but the last bulk reply can still carry
+                # rows past the subtree, so the startswith guard stays.
+                mac_prefix = mac_table_oid + "."
+                mac_len = len(mac_prefix)
+                port_prefix = mac_port_oid + "."
+                port_len = len(port_prefix)
+
+                port_suffix_map = {
+                    oid[port_len:]: val
+                    for oid, val in ports.items()
+                    if oid.startswith(port_prefix)
+                }
+
+                grouped_ports = {}
+
+                # One pass over the MAC walk joined on the suffix (the MAC itself): rows without
+                # a port or on an excluded port are dropped before their MAC is formatted
+                for oid in macs:
+                    if not oid.startswith(mac_prefix):
+                        continue
+                    suffix = oid[mac_len:]
+                    port = port_suffix_map.get(suffix)
+                    if not port:
+                        continue
+                    port_str = str(port)  # keep raw numeric, not padded
+                    if port_str in excluded_ports:
+                        continue  # skip ports the user has excluded
+                    try:
+                        mac = ":".join([_HEX[int(o)] for o in suffix.split(".")])
+                    except (ValueError, IndexError):
+                        _LOGGER.warning("Invalid MAC suffix %s, skipping", suffix)
+                        continue
+                    grouped_ports.setdefault(port_str, []).append(mac)
+
+                new_data["mac_table"] = {
+                    "last_updated": dt_util.utcnow().isoformat(),
+                    "ports": grouped_ports,  # 🔹 raw numeric ports
+                }
+                new_data["last_updated"]["mac_table"] = current_time
+                _LOGGER.debug("MAC table built: %s", new_data["mac_table"])
+            self._last_mac_update = now
+
     # ------------------------------------------------------------------
     # Polling loop: main update
     # ------------------------------------------------------------------
@@ -244,186 +717,73 @@ class SnmpDataUpdateCoordinator(DataUpdateCoordinator):
             )
             _LOGGER.info("SNMP client initialized asynchronously")
 
+        # Wall-clock time stamps last_updated and the counter rates;
+        # the slow/MAC intervals run on the monotonic clock so clock jumps cannot stall them
         current_time = dt_util.utcnow().timestamp()
+        now = time.monotonic()
 
         # Ensure self.data is always a dict (fixes NoneType errors on startup)
         if not isinstance(self.data, dict):
-            self.data = {"previous": {}, "last_updated": {}}
-
-        # Keep snapshot of previous cycle (excluding "previous" key itself)
-        prev_copy = copy.deepcopy(self.data)
-        prev_copy.pop("previous", None)
+            self.data = {"last_updated": {}, "device": self._device_data, "ports": self._port_data}
 
         # Initialize new data container for this cycle
         new_data = {
             "attributes": {},
             "device": {},
             "ports": {},
-            "last_updated": {},
-            "previous": prev_copy,
+            # One timestamp per section (all values of a cycle share it), not one per OID
+            "last_updated": {"_cycle": current_time, "device": current_time},
         }
 
-        # Retrieve device info (used for PoE ports, manufacturer, etc.)
-        #poe_ports = self.config_entry.data.get(CONF_DEVICE_INFO, {}).get("poe_ports", [])
-
-        # Use lock to avoid race conditions with concurrent polls
-        async with self._lock:
-            _LOGGER.debug("Acquired lock for polling")
+        try:
+            # Device, firmware, port and MAC polls use independent OIDs and write
+            # disjoint keys of new_data, so their SNMP round-trips overlap (on slow cycles the
+            # firmware poll first waits for the device poll's sysUpTime)
+            # Tasks are kept on the coordinator so async_abort() can cancel them mid-flight
             try:
-                # ------------------------
-                # DEVICE-LEVEL POLLING
-                # ------------------------
-                for key, entry in self.validated_oids.get("device", {}).items():
-                    if key == "firmware":
-                        continue  # handled separately
-                    oid = entry.get("oid")
-                    if not oid:
-                        continue
-                    try:
-                        value = await self.client.async_get(oid)
-                        if value and value != "No Such Object currently exists at this OID":
-                            new_data["device"][key] = value
-                        else:
-                            new_data["device"][key] = "missing"
-                            _LOGGER.debug(f"Set fallback for device {key}: missing, value={value}")
-                    except Exception as e:
-                        _LOGGER.error(f"Failed to fetch OID {oid} for {key}: {e}")
-                        new_data["device"][key] = "error"
-                    finally:
-                        new_data["last_updated"][f"device_{key}"] = current_time
-
-                # ------------------------
-                # FIRMWARE POLLING (slow cycle)
-                # ------------------------
-                slow_interval = SLOW_UPDATE_CYCLE * self.config_entry.data[CONF_POLLING_INTERVAL]
-                if current_time - self._last_slow_update >= slow_interval:
-                    firmware_entry = self.validated_oids.get("attributes", {}).get("firmware") or \
-                                     self.validated_oids.get("device", {}).get("firmware")
-                    if firmware_entry:
-                        firmware_oid = firmware_entry.get("oid")
-                        if firmware_oid:
-                            _LOGGER.debug(f"Polling firmware OID: {firmware_oid}")
-                            value = await self.client.async_get(firmware_oid)
-                            if value and value != "No Such Object currently exists at this OID":
-                                if value != self._firmware_cache:
-                                    # Update cache and HA device registry
-                                    self._firmware_cache = value
-                                    new_device_info = dict(self.config_entry.data.get(CONF_DEVICE_INFO, {}))
-                                    new_device_info["firmware"] = value
-                                    self.hass.config_entries.async_update_entry(
-                                        self.config_entry,
-                                        data={**self.config_entry.data, CONF_DEVICE_INFO: new_device_info}
-                                    )
-                                    device_registry = async_get_dr(self.hass)
-                                    device_entry_data = {
-                                        "identifiers": {(DOMAIN, self.config_entry.data[CONF_DEVICE_IP])},
-                                        "manufacturer": new_device_info.get("manufacturer", "Unknown"),
-                                        "model": new_device_info.get("model", "Unknown"),
-                                        "name": self.config_entry.data[CONF_DEVICE_NAME],
-                                        "sw_version": value,
-                                        "serial_number": new_device_info.get("serial", None),
-                                        "connections": {("ip", self.config_entry.data[CONF_DEVICE_IP])},
-                                    }
-                                    device_registry.async_get_or_create(
-                                        config_entry_id=self.config_entry.entry_id,
-                                        **device_entry_data
-                                    )
-                                new_data["last_updated"]["device_firmware"] = current_time
-                            else:
-                                self._firmware_cache = "Unknown"
-                    self._last_slow_update = current_time
-                new_data["device"]["firmware"] = self._firmware_cache
-
-                # ------------------------
-                # PORT-LEVEL POLLING
-                # ------------------------
-                for port_key, port_attrs in self.validated_oids.get("ports", {}).items():
-                    new_data["ports"][port_key] = {}
-                    for key, entry in port_attrs.items():
-                        oid = entry.get("oid")
-                        if not oid:
-                            continue
-                        _LOGGER.debug(f"Polling port {port_key} OID {key}: {oid}")
-                        try:
-                            value = await self.client.async_get(oid)
-                            if not (isinstance(value, str) and value.startswith("No Such")):
-                                new_data["ports"][port_key][key] = value
-                            else:
-                                _LOGGER.warning(f"Skipping port {port_key} {key} due to invalid response: {value}")
-                        except Exception as e:
-                            _LOGGER.error(f"Failed to fetch OID {oid} for port {port_key} {key}: {e}")
-                            new_data["ports"][port_key][key] = "error"
-                        finally:
-                            new_data["last_updated"][f"port_{port_key}_{key}"] = current_time
-                    new_data["last_updated"][f"port_{port_key}"] = current_time
-
-                # ------------------------
-                # MAC TABLE POLLING
-                # ------------------------
-                mac_interval = self.config_entry.data[CONF_MAC_UPDATE_CYCLE] * self.config_entry.data[CONF_POLLING_INTERVAL]
-                if current_time - self._last_mac_update >= mac_interval:
-                    mac_table_entry = None
-                    mac_port_entry = None
-                    # Locate "mac_table" and "mac_port" OIDs from device section
-                    for key, entry in self.validated_oids.get("device", {}).items():
-                        if entry.get("type") == "mac_table":
-                            mac_table_entry = entry
-                        elif entry.get("type") == "mac_port":
-                            mac_port_entry = entry
-                    excluded_ports = set(self.config_entry.options.get("mac_excluded_ports", []))
-
-                    if mac_table_entry and mac_port_entry:
-                        mac_table_oid = mac_table_entry.get("oid")
-                        mac_port_oid = mac_port_entry.get("oid")
-                        if mac_table_oid and mac_port_oid:
-                            # Fetch raw SNMP data
-                            macs = await self.client.async_get_subtree(mac_table_oid)
-                            ports = await self.client.async_get_subtree(mac_port_oid)
-                            if macs and ports:
-                                mac_base = mac_table_oid.lstrip(".")
-                                port_base = mac_port_oid.lstrip(".")
-
-                                mac_suffix_map = {
-                                    oid[len(mac_base)+1:]: val
-                                    for oid, val in macs.items()
-                                    if oid.startswith(mac_base + ".")
-                                }
-                                port_suffix_map = {
-                                    oid[len(port_base)+1:]: val
-                                    for oid, val in ports.items()
-                                    if oid.startswith(port_base + ".")
-                                }
-
-                                grouped_ports = {}
-
-                                for suffix, mac_val in mac_suffix_map.items():
-                                    octets = suffix.split(".")
-                                    try:
-                                        mac = ":".join(f"{int(o):02x}" for o in octets)
-                                    except ValueError:
-                                        _LOGGER.warning("Invalid MAC suffix %s, skipping", suffix)
-                                        continue
-                                    port = port_suffix_map.get(suffix)
-                                    if not port:
-                                        continue
-                                    port_str = str(port)  # keep raw numeric, not padded
-                                    if port_str in excluded_ports:
-                                        continue  # skip ports the user has excluded
-                                    grouped_ports.setdefault(port_str, []).append(mac)
-
-                                new_data["mac_table"] = {
-                                    "last_updated": dt_util.utcnow().isoformat(),
-                                    "ports": grouped_ports,  # 🔹 raw numeric ports
-                                }
-                                new_data["last_updated"]["mac_table"] = current_time
-                                _LOGGER.debug("MAC table built: %s", new_data["mac_table"])
-                        self._last_mac_update = current_time
-                # Merge new data into coordinator state (keeps previous + last updated info)
-                self.data.update(new_data)
-                _LOGGER.info("Data update completed successfully")
-            except Exception as e:
-                _LOGGER.error("Error updating data: %s", e)
-                raise
+                async with asyncio.TaskGroup() as group:
+                    device_task = group.create_task(self._poll_device(new_data, current_time, now))
+                    self._poll_tasks = [
+                        device_task,
+                        group.create_task(self._poll_firmware(new_data, current_time, now, device_task)),
+                        group.create_task(self._poll_ports(new_data, current_time, now)),
+                        group.create_task(self._poll_mac_table(new_data, current_time, now)),
+                    ]
+            except BaseExceptionGroup as e:
+                if self._aborted:
+                    # async_abort() cancelled the polls: whatever they raised on the way out is moot
+                    _LOGGER.debug("Polling cancelled for %s, discarding poll errors", self.config_entry.entry_id)
+                    return self.data
+                errors = [err for err in e.exceptions if isinstance(err, Exception)]
+                if not errors:
+                    raise  # cancellation or interpreter exit: propagate as it came
+                for err in errors[1:]:
+                    _LOGGER.error("Poll task failed: %s", err, exc_info=err)
+                # HA expects a single exception from the update; the group stays attached as its cause
+                raise errors[0] from e
             finally:
-                _LOGGER.debug("Released lock for polling")
+                self._poll_tasks = ()
+            # The MAC table keeps its stamp on the cycles that do not walk it
+            previous_mac_update = self.data.get("last_updated", {}).get("mac_table")
+            if previous_mac_update is not None:
+                new_data["last_updated"].setdefault("mac_table", previous_mac_update)
+            if self._aborted:
+                _LOGGER.debug("Polling cancelled for %s, discarding partial results", self.config_entry.entry_id)
+                return self.data
+
+            # Refresh the stable device/port dicts in place so entity views stay valid,
+            # recording which keys actually changed for the key listeners
+            self._apply_section("device", self._device_data, new_data.pop("device"))
+            for port_key, port_values in new_data.pop("ports").items():
+                self._apply_section(port_key, self._port_data.setdefault(port_key, {}), port_values)
+            if self._diff_polls:
+                self._update_rates(current_time)
+            # Merge new data into coordinator state (keeps last updated info)
+            self.data.update(new_data)
+            self.data["device"] = self._device_data
+            self.data["ports"] = self._port_data
+            _LOGGER.info("Data update completed successfully")
+        except Exception as e:
+            _LOGGER.error("Error updating data: %s", e)
+            raise
         return self.data
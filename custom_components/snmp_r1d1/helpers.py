@@ -1,110 +1,205 @@
 """Helper functions for snmp_r1d1 integration."""
 
 import logging
+from collections import namedtuple
+from functools import lru_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw values read as "on" when no vmap decides otherwise
+_TRUE_TOKENS = frozenset(("1", "on", "true"))
+
 
 # ================================================================
 # Boolean vmap (for switch and binary_sensor)
 # ================================================================
-def apply_bool_vmap(value, vmap, sensor_id, logger=_LOGGER):
-    """Map SNMP values to booleans (True/False)."""
+# Boolean vmap parsed once: exact tokens as frozensets, ">"/"<" tokens folded into one
+# threshold per side (any of several ">" tokens matching == the lowest one matching),
+# and the legacy "1"/"0" keys resolved to a bool (None when absent)
+BoolVmap = namedtuple(
+    "BoolVmap", ("on_exact", "on_gt", "on_lt", "off_exact", "off_gt", "off_lt", "one", "zero")
+)
+
+
+def _compile_bool_side(tokens) -> tuple:
+    """Split one side's tokens into (exact frozenset, lowest ">" threshold, highest "<" threshold)."""
+    if tokens is None:
+        return frozenset(), None, None
+    if not isinstance(tokens, list):
+        tokens = [tokens]
+    exact = frozenset(str(token) for token in tokens)
+    gt = []
+    lt = []
+    for token in exact:
+        if token.startswith((">", "<")):
+            try:
+                (gt if token[0] == ">" else lt).append(float(token[1:]))
+            except ValueError:
+                pass  # never matches numerically, same as before
+    return exact, min(gt) if gt else None, max(lt) if lt else None
+
+
+def _legacy_bool(mapped, truthy: tuple) -> bool:
+    """Resolve a legacy "1"/"0" vmap entry to a bool (False if it is not a string)."""
     try:
-        val = str(value)
-
-        if not vmap:  # default fallback
-            return val in ("1", "on", "true")
-
-        def _match(token, val):
-            if token == val:
-                return True
-            if token.startswith(">"):
-                try:
-                    return float(val) > float(token[1:])
-                except ValueError:
-                    return False
-            if token.startswith("<"):
-                try:
-                    return float(val) < float(token[1:])
-                except ValueError:
-                    return False
-            return False
-
-        if "on" in vmap:
-            v_on = vmap["on"]
-            if isinstance(v_on, list):
-                if any(_match(token, val) for token in v_on):
-                    return True
-            elif _match(str(v_on), val):
-                return True
-
-        if "off" in vmap:
-            v_off = vmap["off"]
-            if isinstance(v_off, list):
-                if any(_match(token, val) for token in v_off):
-                    return False
-            elif _match(str(v_off), val):
-                return False
-
-        if "1" in vmap and val == "1":
-            return vmap["1"].lower() in ("on", "true", "1")
-        if "0" in vmap and val == "0":
-            return vmap["0"].lower() in ("off", "false", "0")
-
-        return val in ("1", "on", "true")
+        return mapped.lower() in truthy
+    except AttributeError:
+        return False
 
-    except Exception as e:
-        logger.error("Error applying vmap for %s: %s", sensor_id, e)
+
+def compile_bool_vmap(vmap: dict | None) -> BoolVmap | None:
+    """Parse a boolean vmap once into a BoolVmap (None for an empty vmap)."""
+    if not vmap:
+        return None
+    on_exact, on_gt, on_lt = _compile_bool_side(vmap.get("on"))
+    off_exact, off_gt, off_lt = _compile_bool_side(vmap.get("off"))
+    one = vmap.get("1")
+    zero = vmap.get("0")
+    return BoolVmap(
+        on_exact, on_gt, on_lt, off_exact, off_gt, off_lt,
+        None if one is None else _legacy_bool(one, ("on", "true", "1")),
+        None if zero is None else _legacy_bool(zero, ("off", "false", "0")),
+    )
+
+
+def apply_compiled_bool_vmap(value, compiled: BoolVmap | None) -> bool:
+    """Map an SNMP value to True/False with a compile_bool_vmap() result."""
+    val = str(value)
+    if compiled is None:  # default fallback
+        return val in _TRUE_TOKENS
+
+    # Same precedence as before: "on" tokens, then "off" tokens, then "1"/"0", then the default
+    if val in compiled.on_exact:
+        return True
+    number = None
+    if compiled.on_gt is not None or compiled.on_lt is not None \
+            or compiled.off_gt is not None or compiled.off_lt is not None:
+        try:
+            number = float(val)
+        except ValueError:
+            pass
+    if number is not None and (
+        (compiled.on_gt is not None and number > compiled.on_gt)
+        or (compiled.on_lt is not None and number < compiled.on_lt)
+    ):
+        return True
+    if val in compiled.off_exact:
+        return False
+    if number is not None and (
+        (compiled.off_gt is not None and number > compiled.off_gt)
+        or (compiled.off_lt is not None and number < compiled.off_lt)
+    ):
         return False
 
+    if val == "1" and compiled.one is not None:
+        return compiled.one
+    if val == "0" and compiled.zero is not None:
+        return compiled.zero
+    return val in _TRUE_TOKENS
+
+
+def build_bool_vmap_table(vmap: dict | None) -> dict | None:
+    """Precompute apply_compiled_bool_vmap() as an exact-match lookup table.
+
+    Resolves a constant vmap once so the per-state-read path becomes a single
+    dict lookup on the raw (string) value. Values that are not in the table are False.
+
+    Returns:
+        dict | None: the table, or None when the vmap uses "<"/">" comparisons,
+        which cannot be tabulated; callers then fall back to
+        apply_compiled_bool_vmap() with a compile_bool_vmap() result.
+    """
+    tokens = []
+    for side in ("on", "off") if vmap else ():
+        value = vmap.get(side)
+        if value is not None:
+            tokens.extend(value if isinstance(value, list) else [value])
+    if any(str(token).startswith((">", "<")) for token in tokens):
+        return None
+
+    table = {}
+    try:
+        if vmap:
+            # Same precedence as apply_compiled_bool_vmap: "on", then "off", then "1"/"0"
+            for side, result in (("on", True), ("off", False)):
+                value = vmap.get(side)
+                if value is None:
+                    continue
+                for token in value if isinstance(value, list) else [value]:
+                    table.setdefault(str(token), result)
+            one = vmap.get("1")
+            if one is not None:
+                table.setdefault("1", one.lower() in ("on", "true", "1"))
+            zero = vmap.get("0")
+            if zero is not None:
+                table.setdefault("0", zero.lower() in ("off", "false", "0"))
+        # Default fallback when nothing in the vmap matched
+        for token in ("1", "on", "true"):
+            table.setdefault(token, True)
+    except Exception:
+        return None
+    return table
+
+
 # ================================================================
 # Numeric/String vmap (for sensor values) Apply value mapping (e.g. 1=up, 2=down)
 # ================================================================
-def apply_vmap(value, vmap, sensor_id, logger=_LOGGER):
-    """Apply value mapping for sensors (numeric/string)."""
-    if not vmap or value is None:
-        return value
+# Comparison kinds of a compiled vmap entry
+VMAP_EQ = 0  # exact match against str(value)
+VMAP_GT = 1  # ">N": float(value) > N
+VMAP_LT = 2  # "<N": float(value) < N
 
-    #  Start-of-call context
-    logger.debug("apply_vmap start [%s]: value=%r, vmap=%s", sensor_id, value, vmap)
+# Marks the numeric form of a value as not yet converted
+_UNCONVERTED = object()
 
-    try:
-        for key, mapped in vmap.items():
-            if key.startswith(">") or key.startswith("<"):
-                # Only compare numerically if value is numeric
-                try:
-                    v = float(value)
-                    t = float(key[1:])
-                    if key.startswith(">") and v > t:
-                        return mapped
-                    if key.startswith("<") and v < t:
-                        return mapped
-                except (TypeError, ValueError):
-                    #  Skip bad numeric compares instead of erroring
-                    logger.debug(
-                        "apply_vmap skip numeric compare [%s]: value=%r not numeric for threshold '%s'",
-                        sensor_id,
-                        value,
-                        key,
-                    )
-                    continue
-            elif str(value) == key:
-                return mapped
 
+def compile_vmap(vmap: dict | None) -> tuple:
+    """Parse a sensor vmap once into a tuple of (kind, operand, mapped), in vmap order.
+
+    ">N"/"<N" keys become numeric comparisons with a float operand, every other
+    key an exact string match. Threshold keys that are not numbers are dropped,
+    as they can never match.
+    """
+    compiled = []
+    for key, mapped in (vmap or {}).items():
+        if key.startswith((">", "<")):
+            try:
+                threshold = float(key[1:])
+            except ValueError:
+                continue
+            compiled.append((VMAP_GT if key[0] == ">" else VMAP_LT, threshold, mapped))
+        else:
+            compiled.append((VMAP_EQ, key, mapped))
+    return tuple(compiled)
+
+
+def apply_compiled_vmap(value, compiled: tuple):
+    """Apply a compile_vmap() result: the first matching entry's mapping, else value unchanged."""
+    if not compiled or value is None:
         return value
-    except Exception as e:
-        logger.error("Error applying vmap for %s: %s", sensor_id, e)
-        logger.debug(
-            "apply_vmap context [%s]: value=%r, vmap=%s", sensor_id, value, vmap
-        )
-        return value
+    value_str = str(value)
+    number = _UNCONVERTED  # float(value), converted on the first threshold entry only
+    for kind, operand, mapped in compiled:
+        if kind == VMAP_EQ:
+            if value_str == operand:
+                return mapped
+            continue
+        if number is _UNCONVERTED:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                number = None
+        if number is None:
+            continue  # non-numeric values never match a threshold
+        if (number > operand) if kind == VMAP_GT else (number < operand):
+            return mapped
+    return value
 
 
 # ================================================================
 # Boolean → SNMP mapping (write path)
 # ================================================================
-def to_snmp_bool(state: bool, vmap: dict, sensor_id: str, logger=_LOGGER):
+def to_snmp_bool(state: bool, vmap: dict, sensor_id: str, logger=_LOGGER) -> str | int | None:
     """Convert a boolean state (True/False) into the SNMP raw value using vmap.
 
     Args:
@@ -134,7 +229,8 @@ def to_snmp_bool(state: bool, vmap: dict, sensor_id: str, logger=_LOGGER):
 # Entity naming helpers
 # ================================================================
 
-def make_entity_name(sensor_type: str, port_key: str = None) -> str:
+@lru_cache(maxsize=2048)
+def make_entity_name(sensor_type: str, port_key: str | None = None) -> str:
     """Generate a friendly name for HA entity.
     
     Examples:
@@ -143,21 +239,18 @@ def make_entity_name(sensor_type: str, port_key: str = None) -> str:
         make_entity_name("poe_status", port_key="p05")
             → "Port-05 Poe Status"
     """
-    base = sensor_type.replace("_", " ").title()
+    title = sensor_type.replace("_", " ").title()
+    if not port_key:
+        return f"Device {title}"
+    return f"Port-{port_key[1:] if port_key.startswith('p') else port_key} {title}"
 
-    if port_key:
-        port_num = port_key[1:] if port_key.startswith("p") else port_key
-        location_part = f"Port-{port_num}"
-    else:
-        location_part = "Device"
 
-    return f"{location_part} {base}"
-    
 # ================================================================
 # Helper: Consistent unique_id generator for entities
 # ================================================================
+@lru_cache(maxsize=2048)
 def make_entity_id(
-    entry_id: str, entity_type: str, key_name: str, port: str = None
+    entry_id: str, entity_type: str, key_name: str, port: str | None = None
 ) -> str:
     """Build a consistent entity unique_id for Home Assistant entities.
 
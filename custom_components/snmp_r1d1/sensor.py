@@ -4,9 +4,9 @@ import logging
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.util import dt as dt_util
 import re
 import math
+from functools import lru_cache
 from .const import *
 from .helpers import *
 from . import mac_table
@@ -17,111 +17,65 @@ _LOGGER = logging.getLogger(__name__)
 # ================================================================
 # Helper: Safe math formula evaluation
 # ================================================================
-def eval_formula(formula: str, x):
-    """Safely evaluate a math formula string with one variable x."""
-    try:
-        x_val = float(x)  # convert input to float if possible
-    except (ValueError, TypeError):
-        return x  # if not numeric, return unchanged
+# Names a formula may use besides x: the math module only, no builtins
+_MATH_NAMES = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
+_MATH_NAMES["__builtins__"] = None
+
 
+@lru_cache(maxsize=256)
+def _compile_formula(formula: str):
+    """Normalize and compile a math formula once into a function of x; None if it does not compile."""
     # Normalize formulas like 2(x+1) → 2*(x+1), (2+3)10 → (2+3)*10
     formula = re.sub(r"\)(\d)", r")*\1", formula)
     formula = re.sub(r"(\d)\(", r"\1*(", formula)
     formula = re.sub(r"\)([a-zA-Z])", r")*\1", formula)
     formula = re.sub(r"([a-zA-Z])\(", r"\1*(", formula)
     formula = re.sub(r"(\d)([a-zA-Z])", r"\1*\2", formula)
-
-    # Replace variable x with actual value
-    formula = formula.replace("x", str(x_val))
-
-    # Only allow math module functions (safe)
-    allowed = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
-    allowed["__builtins__"] = None
-
     try:
-        result = eval(formula, allowed, {})
-        # Convert float like 40.0 → 40
-        return int(result) if isinstance(result, float) and result.is_integer() else result
-    except Exception:
-        return x
+        # A real function: x is a fast local and each sample is a plain call, not an eval()
+        return eval(compile(f"lambda x: ({formula})", "<math>", "eval"), _MATH_NAMES)
+    except (SyntaxError, ValueError):  # ValueError: source contains a null byte
+        _LOGGER.warning("Ignoring invalid math formula %r", formula)
+        return None
+
 
 # ================================================================
 # Helper: Apply calculation (direct, diff, or formula)
 # ================================================================
-def apply_calc(raw_value, entry, coordinator, sensor_id, is_port=False, port_key=None):
-    """Apply calculation based on calc type, then optional math formula."""
-    calc_type = entry.get("calc", "direct")  # default is "direct"
+def build_calc(entry, coordinator, sensor_id, is_port=False, port_key=None):
+    """Resolve an entry's calc type and math formula once into a function of the raw value.
+
+    calc "diff" reads the counter's per-second rate (computed by the coordinator once
+    per poll, for all counters together); "direct" and unknown types use the raw
+    value. The optional math formula is then applied to the result.
+    """
+    # Rate of a diff counter, looked up under (section, key); None for direct values
+    rate_key = (port_key if is_port else "device", entry.get("key")) if entry.get("calc") == "diff" else None
     math_formula = entry.get("math")  # optional formula string
+    func = _compile_formula(math_formula) if math_formula else None
+    counter_rate = coordinator.counter_rate
 
-    try:
-        # ------------------------
-        # direct = use raw value
-        # ------------------------
-        if calc_type == "direct":
-            result = raw_value
-
-        # ------------------------
-        # diff = calculate rate of change
-        # ------------------------
-        elif calc_type == "diff":
-            previous_data = coordinator.data.get("previous", {})
-
-            # Port-level diff calculation
-            if is_port:
-                previous_port_data = previous_data.get("ports", {}).get(port_key, {})
-                previous_raw = previous_port_data.get(entry.get("key"))
-                previous_timestamp = previous_data.get("last_updated", {}).get(
-                    f"port_{port_key}_{entry.get('key')}", 0
-                )
-            # Device-level diff calculation
+    def calc(raw_value):
+        try:
+            if rate_key is None:
+                result = raw_value
             else:
-                previous_device_data = previous_data.get("device", {})
-                previous_raw = previous_device_data.get(entry.get("key"))
-                previous_timestamp = previous_data.get("last_updated", {}).get(
-                    f"device_{entry.get('key')}", 0
-                )
-
-            current_timestamp = dt_util.utcnow().timestamp()
-            elapsed_time = current_timestamp - previous_timestamp
-
-            # If first poll or no valid history → no diff
-            if not previous_data or previous_raw is None or elapsed_time <= 0:
-                return None
-
-            try:
-                current_raw = float(raw_value)
-                previous_raw = float(previous_raw)
-            except (ValueError, TypeError):
-                return None
-
-            # Skip if counter reset
-            if current_raw < previous_raw:
-                return None
-
-            try:
-                # Calculate rate (per second)
-                result = (current_raw - previous_raw) / elapsed_time
-                result = round(result, 2)
-            except Exception:
-                return None
-
-        # ------------------------
-        # Unknown type → raw value
-        # ------------------------
-        else:
-            result = raw_value
-
-        # Apply optional math formula
-        if math_formula and result is not None:
+                result = counter_rate(*rate_key)
+                if result is None:
+                    return None
+            if func is None or result is None:
+                return result
             try:
-                result = eval_formula(math_formula, result)
+                value = func(float(result))
             except Exception:
-                pass
-        return result
+                return result  # not numeric, or the formula failed: value unchanged
+            # Convert float like 40.0 → 40
+            return int(value) if isinstance(value, float) and value.is_integer() else value
+        except Exception as e:
+            _LOGGER.error(f"Error applying calc for {sensor_id}: {e}")
+            return raw_value
 
-    except Exception as e:
-        _LOGGER.error(f"Error applying calc for {sensor_id}: {e}")
-        return raw_value
+    return calc
 
 
 # ================================================================
@@ -132,54 +86,43 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     _LOGGER.info("Starting sensor setup")
     coordinator: SnmpDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     device_info_data = config_entry.data.get(CONF_DEVICE_INFO, {})
-        # Device metadata (manufacturer, model, etc.)
-    device_info = {
-        "identifiers": {(DOMAIN, config_entry.data[CONF_DEVICE_IP])},
-        "name": config_entry.data[CONF_DEVICE_NAME],
-        "manufacturer": device_info_data.get("manufacturer", "Unknown"),
-        "model": device_info_data.get("model", "Unknown"),
-    }
+    # Device metadata for HA registry (shared, built once on the coordinator)
+    device_info = coordinator.device_info
     entities = []
 
 
     # ----------------------------
     # Device-level OID sensors
     # ----------------------------
-    for key, entry in coordinator.validated_oids.get("device", {}).items():
-        entity_type = entry.get("type", "sensor")
-        if entity_type == "sensor":
-            entry["key"] = key
-            entities.append(SnmpSensor(coordinator, device_info, key, entry))
-            _LOGGER.debug(f"Added device sensor: {key}")
-        elif entity_type == "text_sensor":
-            entities.append(SnmpTextSensor(coordinator, device_info, key, entry))
-            _LOGGER.debug(f"Added device text sensor: {key}")
+    sensor_oids = coordinator.oids_for_type("sensor")
+    text_sensor_oids = coordinator.oids_for_type("text_sensor")
+
+    for key, entry in sensor_oids["device"]:
+        entry["key"] = key
+        entities.append(SnmpSensor(coordinator, device_info, key, entry))
+        _LOGGER.debug(f"Added device sensor: {key}")
+    for key, entry in text_sensor_oids["device"]:
+        entities.append(SnmpTextSensor(coordinator, device_info, key, entry))
+        _LOGGER.debug(f"Added device text sensor: {key}")
 
     # ----------------------------
     # Port-level OID sensors
     # ----------------------------
-    for port_key, port_attrs in coordinator.validated_oids.get("ports", {}).items():
-        for key, entry in port_attrs.items():
-            entity_type = entry.get("type", "sensor")
-            if entity_type == "sensor":
-                entry["key"] = key
-                entities.append(SnmpPortSensor(coordinator, device_info, key, entry, port_key))
-                _LOGGER.debug(f"Added port sensor: {port_key}_{key}")
-            elif entity_type == "text_sensor":
-                entities.append(SnmpPortTextSensor(coordinator, device_info, key, entry, port_key))
-                _LOGGER.debug(f"Added port text sensor: {port_key}_{key}")
+    for port_key, port_attrs in sensor_oids["ports"].items():
+        for key, entry in port_attrs:
+            entry["key"] = key
+            entities.append(SnmpPortSensor(coordinator, device_info, key, entry, port_key))
+            _LOGGER.debug(f"Added port sensor: {port_key}_{key}")
+    for port_key, port_attrs in text_sensor_oids["ports"].items():
+        for key, entry in port_attrs:
+            entities.append(SnmpPortTextSensor(coordinator, device_info, key, entry, port_key))
+            _LOGGER.debug(f"Added port text sensor: {port_key}_{key}")
 
     # ----------------------------
     # MAC table sensors (if OIDs exist)
     # ----------------------------
-    has_mac_table = any(
-        entry.get("type") == "mac_table"
-        for entry in coordinator.validated_oids.get("device", {}).values()
-    )
-    has_mac_port = any(
-        entry.get("type") == "mac_port"
-        for entry in coordinator.validated_oids.get("device", {}).values()
-    )
+    has_mac_table = bool(coordinator.oids_for_type("mac_table")["device"])
+    has_mac_port = bool(coordinator.oids_for_type("mac_port")["device"])
 
     if has_mac_table and has_mac_port:
         port_count = int(device_info_data.get("port_count", 1))
@@ -218,6 +161,9 @@ class SnmpSensor(SensorEntity):
         self._attr_device_class = entry.get("device_class")
         self._attr_native_unit_of_measurement = entry.get("native_unit_of_measurement")
         self._entry = entry
+        self._vmap = compile_vmap(entry.get("vmap"))  # Parsed once, applied on every state read
+        self._calc = build_calc(entry, coordinator, self._attr_unique_id)  # calc + math, resolved once
+        self._values = coordinator.device_view  # Live read-only view of device values
 
     async def async_added_to_hass(self):
         # Register for coordinator updates
@@ -226,14 +172,12 @@ class SnmpSensor(SensorEntity):
     @property
     def native_value(self):
         # Get raw value
-        if not self.coordinator.data or "device" not in self.coordinator.data:
-            return None
-        raw_value = self.coordinator.data["device"].get(self.sensor_type)
+        raw_value = self._values.get(self.sensor_type)
         if raw_value is None:
             return None
         # Apply transformations
-        processed_value = apply_calc(raw_value, self._entry, self.coordinator, self._attr_unique_id)
-        return apply_vmap(processed_value, self._entry.get("vmap", {}), self._attr_unique_id)
+        processed_value = self._calc(raw_value)
+        return apply_compiled_vmap(processed_value, self._vmap)
 
 
 # ================================================================
@@ -259,25 +203,26 @@ class SnmpPortSensor(SensorEntity):
         self._attr_device_class = entry.get("device_class")
         self._attr_native_unit_of_measurement = entry.get("native_unit_of_measurement")
         self._entry = entry
+        self._vmap = compile_vmap(entry.get("vmap"))  # Parsed once, applied on every state read
+        self._calc = build_calc(entry, coordinator, self._attr_unique_id, is_port=True, port_key=padded_port_key)
+        self._values = coordinator.port_view(padded_port_key)  # Live read-only view of this port's values
 
     async def async_added_to_hass(self):
         self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
 
     @property
     def native_value(self):
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
-            return None
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        raw_value = port_data.get(self.sensor_type)
-        _LOGGER.debug("raw value [%s]: raw='%s'", self._attr_unique_id, raw_value)
-
+        raw_value = self._values.get(self.sensor_type)
         if raw_value is None:
             return None
-        processed_value = apply_calc(raw_value, self._entry, self.coordinator, self._attr_unique_id, is_port=True, port_key=self.padded_port_key)
-        _LOGGER.debug("apply_calc trace [%s]: raw='%s' → processed='%s'", self._attr_unique_id, raw_value, processed_value)
-        _LOGGER.debug("vmap trace [%s]: raw=%r → processed=%r; vmap=%s", self._attr_unique_id, raw_value, processed_value, self._entry.get("vmap", {}))
-
-        return apply_vmap(processed_value, self._entry.get("vmap", {}), self._attr_unique_id)
+        processed_value = self._calc(raw_value)
+        # Read for every port sensor on every write: only build the trace when debug is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "value trace [%s]: raw=%r → processed=%r; vmap=%s",
+                self._attr_unique_id, raw_value, processed_value, self._entry.get("vmap"),
+            )
+        return apply_compiled_vmap(processed_value, self._vmap)
 
 
 # ================================================================
@@ -296,15 +241,16 @@ class SnmpTextSensor(SensorEntity):
         self._attr_unique_id = make_entity_id(coordinator.config_entry.entry_id, "text_sensor", sensor_type)
         self._attr_name = make_entity_name(sensor_type)
         self._entry = entry
+        self._values = coordinator.device_view  # Live read-only view of device values
 
     async def async_added_to_hass(self):
         self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
 
     @property
     def state(self):
-        if not self.coordinator.data or "device" not in self.coordinator.data:
+        if not self._values:
             return None
-        return self.coordinator.data["device"].get(self.sensor_type, "")
+        return self._values.get(self.sensor_type, "")
 
 
 # ================================================================
@@ -324,12 +270,13 @@ class SnmpPortTextSensor(SensorEntity):
         self._attr_unique_id = make_entity_id(coordinator.config_entry.entry_id, "text_sensor", sensor_type, padded_port_key)
         self._attr_name = make_entity_name(sensor_type, port_key=padded_port_key)
         self._entry = entry
+        self._values = coordinator.port_view(padded_port_key)  # Live read-only view of this port's values
 
     async def async_added_to_hass(self):
         self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
 
     @property
     def state(self):
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
+        if not self._values:
             return None
-        return self.coordinator.data["ports"].get(self.padded_port_key, {}).get(self.sensor_type, "")
\ No newline at end of file
+        return self._values.get(self.sensor_type, "")
\ No newline at end of file
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass
+from contextlib import aclosing
+from dataclasses import astuple, dataclass
 from pysnmp.smi import view
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 from pysnmp.hlapi.asyncio import (
     get_cmd,          # SNMP GET request
     set_cmd,          # SNMP SET request
@@ -34,6 +36,52 @@ _LOGGER = logging.getLogger(__name__)
 
 _snmp_engine = None  # Cached SNMP engine instance
 
+# Clients keyed by (host, credential fields), shared by the config flow and the
+# coordinator so a device keeps one client (and its resolved transport) across them.
+# Every create() must be paired with a release(); a client leaves the pool with its last holder.
+_client_pool = {}
+
+# Rows requested per column GETBULK (agents may still return fewer if the reply gets too big)
+MAX_BULK_REPETITIONS = 64
+# Varbinds one column GETBULK asks for (columns x repetitions); columns are packed into a request up to this
+MAX_BULK_VARBINDS = 128
+
+# SNMP versions authenticated with community strings
+_COMMUNITY_VERSIONS = frozenset(("v1", "v2c"))
+
+# Requests in flight at once per client; concurrent polls queue behind this so weak agents are not flooded
+MAX_INFLIGHT_REQUESTS = 4
+
+# Exception values an agent returns in place of a value for an OID it does not hold
+_NO_SUCH_TYPES = (NoSuchObject, NoSuchInstance, EndOfMibView)
+
+
+class _NoSuchOid:
+    """Type of NO_SUCH_OID (one instance; test with `value is NO_SUCH_OID`)."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "NO_SUCH_OID"
+
+
+# Returned by the GET methods for noSuchObject/noSuchInstance replies, instead of their
+# pysnmp message text, so callers do not depend on how pysnmp words it
+NO_SUCH_OID = _NoSuchOid()
+
+
+def _to_value(val):
+    """Convert a varbind value to the GET result: str, NO_SUCH_OID, or None."""
+    if val is None:
+        return None
+    if isinstance(val, _NO_SUCH_TYPES):
+        return NO_SUCH_OID
+    return str(val)
+
+
+# Varbinds per multi-OID GET request (keeps the response PDU well below typical UDP/agent limits)
+MAX_GET_VARBINDS = 20
+
 
 def _init_snmp_engine() -> SnmpEngine:
     """Blocking initialization of SnmpEngine — must be called from executor thread."""
@@ -74,7 +122,7 @@ class SnmpCredentials:
 
     def __post_init__(self):
         """Validate credentials based on version."""
-        if self.version in ["v1", "v2c"]:
+        if self.version in _COMMUNITY_VERSIONS:
             # v1/v2c requires a community string
             if not self.read_community:
                 raise ValueError("Read community string is required for SNMP v1/v2c")
@@ -94,21 +142,49 @@ class SnmpClient:
         self.credentials = credentials
         self.engine = None  # Initialized lazily via create()
         self.context = ContextData()  # Context data (mainly for v3)
+        self._transport = None  # UDP transport target, resolved once and reused
+        self._auth_data = {}  # CommunityData/UsmUserData per operation ("read"/"write"), reused across requests
+        self._inflight = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)  # Caps concurrent PDUs to this agent
+        self._holders = 0  # create() calls not yet matched by release()
 
     @classmethod
     async def create(cls, host: str, credentials: SnmpCredentials) -> "SnmpClient":
-        """Async factory: create and fully initialize an SnmpClient."""
-        client = cls(host, credentials)
-        client.engine = await async_get_snmp_engine()
+        """Async factory: return the pooled SnmpClient for host + credentials, creating it on first use.
+
+        Each call holds the client until the matching release().
+        """
+        key = (host, astuple(credentials))
+        client = _client_pool.get(key)
+        if client is None:
+            client = cls(host, credentials)
+            client.engine = await async_get_snmp_engine()
+            _client_pool[key] = client
+        client._holders += 1
         return client
 
+    def release(self):
+        """Drop one hold on this client; the last release removes it from the pool."""
+        self._holders -= 1
+        if self._holders > 0:
+            return
+        key = (self.host, astuple(self.credentials))
+        if _client_pool.get(key) is self:
+            del _client_pool[key]
+
     # ----------------------
     # Helper: Authentication
     # ----------------------
     def _get_auth_data(self, operation: str = "read"):
+        """Return authentication data for the specified operation, built once per operation."""
+        auth_data = self._auth_data.get(operation)
+        if auth_data is None:
+            auth_data = self._auth_data[operation] = self._build_auth_data(operation)
+        return auth_data
+
+    def _build_auth_data(self, operation: str):
         """Configure authentication data for the specified operation."""
         version = self.credentials.version
-        if version in ["v1", "v2c"]:
+        if version in _COMMUNITY_VERSIONS:
             # SNMP v1/v2c uses community strings
             community = (
                 self.credentials.write_community
@@ -151,8 +227,10 @@ class SnmpClient:
     async def _prepare_snmp_args(self, oid, operation="read", value=None, value_type="string"):
         """Prepare common SNMP call arguments."""
         auth_data = self._get_auth_data(operation)
-        # Create transport target (UDP/IPv4, port 161, timeout 5s)
-        transport = await UdpTransportTarget.create((self.host, 161), 5)
+        # Transport target (UDP/IPv4, port 161, timeout 5s): the host lookup runs once per client
+        transport = self._transport
+        if transport is None:
+            transport = self._transport = await UdpTransportTarget.create((self.host, 161), 5)
         context = self.context
 
         # If writing, wrap value in appropriate SNMP type
@@ -198,23 +276,85 @@ class SnmpClient:
         for attempt in range(retries + 1):
             try:
                 args = await self._prepare_snmp_args(oid, operation="read")
-                error_indication, error_status, error_index, var_binds = await get_cmd(
-                    *args, lookupMib=False
-                )
+                async with self._inflight:
+                    error_indication, error_status, error_index, var_binds = await get_cmd(
+                        *args, lookupMib=False
+                    )
 
                 if error_indication:
                     raise Exception(error_indication)
                 if error_status:
                     raise Exception(error_status.prettyPrint())
-                if not var_binds or var_binds[0][1] is None:
+                if not var_binds:
                     return None
-                return str(var_binds[0][1])  # Return the value as string
+                return _to_value(var_binds[0][1])  # Value as string (or NO_SUCH_OID)
             except Exception as e:
                 _LOGGER.error(f"SNMP get attempt {attempt + 1} failed for OID {oid}: {e}")
                 if attempt == retries:
                     return None
                 await asyncio.sleep(5)
 
+    async def async_get_many(self, oids, retries=1, chunk_size=MAX_GET_VARBINDS):
+        """Retrieve several OID values, packing up to chunk_size varbinds per GET request.
+
+        Returns a dict {oid: value} with the same value semantics as async_get()
+        (string value, or None on failure). The chunks are sent concurrently (bounded
+        by MAX_INFLIGHT_REQUESTS), so N OIDs cost about one round-trip rather than
+        N / chunk_size. If the agent rejects a multi-varbind request (e.g. SNMPv1
+        noSuchName, tooBig), that chunk falls back to concurrent single GETs.
+        """
+        chunks = [oids[start:start + chunk_size] for start in range(0, len(oids), chunk_size)]
+        if len(chunks) == 1:
+            return dict(zip(chunks[0], await self._async_get_chunk_or_singles(chunks[0], retries)))
+        results = {}
+        for chunk, values in zip(chunks, await asyncio.gather(
+            *(self._async_get_chunk_or_singles(chunk, retries) for chunk in chunks)
+        )):
+            results.update(zip(chunk, values))
+        return results
+
+    async def _async_get_chunk_or_singles(self, chunk, retries):
+        """GET one chunk in a single request, falling back to single GETs if it is rejected."""
+        values = await self._async_get_chunk(chunk, retries)
+        if values is None:
+            # The single GETs are independent, so issue them concurrently
+            _LOGGER.debug("Multi-OID GET rejected, falling back to single GETs for %d OIDs", len(chunk))
+            values = await asyncio.gather(
+                *(self.async_get(oid, retries=retries) for oid in chunk),
+                return_exceptions=True,
+            )
+            values = [None if isinstance(value, Exception) else value for value in values]
+        return values
+
+    async def _async_get_chunk(self, oids, retries=1):
+        """Send one GET carrying all given OIDs.
+
+        Returns a list of values aligned with oids, or None if the agent answered
+        with an error status (caller should retry the OIDs one by one).
+        """
+        for attempt in range(retries + 1):
+            try:
+                engine, auth_data, transport, context, first_obj = await self._prepare_snmp_args(oids[0])
+                objs = [first_obj] + [ObjectType(ObjectIdentity(oid)) for oid in oids[1:]]
+                async with self._inflight:
+                    error_indication, error_status, error_index, var_binds = await get_cmd(
+                        engine, auth_data, transport, context, *objs, lookupMib=False
+                    )
+
+                if error_indication:
+                    raise Exception(error_indication)
+                if error_status:
+                    _LOGGER.debug("SNMP multi-get error status for %d OIDs: %s", len(oids), error_status.prettyPrint())
+                    return None
+                if len(var_binds) != len(oids):
+                    return None
+                return [_to_value(val) for _, val in var_binds]
+            except Exception as e:
+                _LOGGER.error(f"SNMP multi-get attempt {attempt + 1} failed for {len(oids)} OIDs: {e}")
+                if attempt == retries:
+                    return [None] * len(oids)
+                await asyncio.sleep(5)
+
     async def async_set(self, oid, value, value_type="string", retries=1):
         """Set an OID value and verify with a follow-up get."""
         for attempt in range(retries + 1):
@@ -222,9 +362,10 @@ class SnmpClient:
                 args = await self._prepare_snmp_args(
                     oid, operation="write", value=value, value_type=value_type
                 )
-                error_indication, error_status, error_index, var_binds = await set_cmd(
-                    *args, lookupMib=False
-                )
+                async with self._inflight:
+                    error_indication, error_status, error_index, var_binds = await set_cmd(
+                        *args, lookupMib=False
+                    )
 
                 if error_indication or error_status:
                     raise Exception(error_indication or error_status.prettyPrint())
@@ -247,9 +388,10 @@ class SnmpClient:
         for attempt in range(retries + 1):
             try:
                 args = await self._prepare_snmp_args(oid)
-                error_indication, error_status, error_index, var_binds = await next_cmd(
-                    *args, lexicographicMode=False, lookupMib=False
-                )
+                async with self._inflight:
+                    error_indication, error_status, error_index, var_binds = await next_cmd(
+                        *args, lexicographicMode=False, lookupMib=False
+                    )
 
                 if error_indication:
                     raise Exception(error_indication)
@@ -299,12 +441,13 @@ class SnmpClient:
             try:
                 engine, auth_data, transport, context, _ = await self._prepare_snmp_args(oid)
 
-                error_indication, error_status, error_index, var_binds_table = await bulk_cmd(
-                    engine, auth_data, transport, context,
-                    non_repeaters, max_repetitions,
-                    ObjectType(ObjectIdentity(oid)),
-                    lookupMib=False
-                )
+                async with self._inflight:
+                    error_indication, error_status, error_index, var_binds_table = await bulk_cmd(
+                        engine, auth_data, transport, context,
+                        non_repeaters, max_repetitions,
+                        ObjectType(ObjectIdentity(oid)),
+                        lookupMib=False
+                    )
                 _LOGGER.warning("async_getbulk raw var_binds_table for OID=%s: %r", oid, var_binds_table)
 
                 if error_indication:
@@ -324,7 +467,121 @@ class SnmpClient:
                 await asyncio.sleep(5)
 
         return result if result else None
-        
+
+    async def async_get_column_group(self, columns, max_repetitions, retries=1, start_oids=None):
+        """Read up to max_repetitions rows of several table columns with a single GETBULK.
+
+        Each column is one varbind of the request, so the reply interleaves the
+        columns row by row. start_oids, aligned with columns, lets a column's rows
+        start after a given instance instead of at its first row. Returns a dict
+        {oid: value} for the rows inside the requested columns (OIDs without a
+        leading dot, values as in async_get()), or None if the request failed.
+        """
+        wanted = frozenset(column.strip(".") for column in columns)
+        start_oids = start_oids or columns
+        for attempt in range(retries + 1):
+            try:
+                engine, auth_data, transport, context, first_obj = await self._prepare_snmp_args(start_oids[0])
+                objs = [first_obj] + [ObjectType(ObjectIdentity(oid)) for oid in start_oids[1:]]
+                async with self._inflight:
+                    error_indication, error_status, error_index, var_binds = await bulk_cmd(
+                        engine, auth_data, transport, context,
+                        0, max_repetitions,
+                        *objs,
+                        lookupMib=False
+                    )
+                if error_indication:
+                    raise Exception(error_indication)
+                if error_status:
+                    raise Exception(error_status.prettyPrint())
+
+                result = {}
+                for oid_obj, val_obj in var_binds:
+                    if isinstance(val_obj, EndOfMibView):
+                        continue
+                    oid_str = str(oid_obj)
+                    # A column that ran out of rows continues into whatever follows it: skip those
+                    if oid_str.rpartition(".")[0] in wanted:
+                        result[oid_str] = str(val_obj)
+                return result
+            except Exception as e:
+                if attempt == retries:
+                    _LOGGER.warning("SNMP column getbulk failed for %s after %d attempts: %s", columns, attempt + 1, e)
+                    return None
+                _LOGGER.debug("SNMP column getbulk attempt %d failed for %s: %s", attempt + 1, columns, e)
+                await asyncio.sleep(5)
+        return None
+
+    @staticmethod
+    def plan_columns(oids):
+        """Group instance OIDs (<column>.<index>) into the column GETBULKs async_get_columns() sends.
+
+        Each column's rows are scoped to the polled index range: the GETBULK starts
+        right after the instance below the lowest polled index, so leading rows that
+        are not polled (e.g. excluded uplink ports) are neither requested nor returned.
+        Columns with more than one row are packed several to a request, as long as
+        columns x repetitions stays within MAX_BULK_VARBINDS. Returns a tuple of
+        ((column OID, ...), (start OID, ...), max_repetitions, ((instance OID, reply OID), ...)),
+        one per GETBULK; the reply OID is the instance OID without a leading dot, as
+        pysnmp renders it. The plan only depends on the OIDs, so callers polling the
+        same OIDs every cycle can build it once and pass it back in.
+        """
+        columns = {}  # column OID -> [(instance OID, index)]
+        for oid in oids:
+            column, _sep, index = oid.rpartition(".")
+            if index.isdigit():
+                columns.setdefault(column, []).append((oid, int(index)))
+
+        plan = []
+        group, group_starts, group_repetitions, group_oids = [], [], 0, []
+        for column, rows in columns.items():
+            if len(rows) < 2:
+                continue
+            first = min(index for _oid, index in rows)
+            span = min(max(index for _oid, index in rows) - first + 1, MAX_BULK_REPETITIONS)
+            repetitions = max(group_repetitions, span)
+            if group and (len(group) + 1) * repetitions > MAX_BULK_VARBINDS:
+                plan.append((tuple(group), tuple(group_starts), group_repetitions, tuple(group_oids)))
+                group, group_starts, group_oids = [], [], []
+                repetitions = span
+            group.append(column)
+            group_starts.append(f"{column}.{first - 1}" if first > 0 else column)
+            group_repetitions = repetitions
+            group_oids.extend((oid, oid.lstrip(".")) for oid, _index in rows)
+        if group:
+            plan.append((tuple(group), tuple(group_starts), group_repetitions, tuple(group_oids)))
+        return tuple(plan)
+
+    async def async_get_columns(self, oids, retries=1, plan=None):
+        """Fetch instance OIDs (<column>.<index>) with multi-column GETBULKs, sent concurrently.
+
+        Returns {oid: value} for the OIDs the bulk replies covered. Columns with a
+        single OID, rows beyond MAX_BULK_REPETITIONS and SNMPv1 agents (no GETBULK)
+        are left out; callers fetch whatever is missing with async_get_many().
+        plan is a prebuilt plan_columns(oids) result.
+        """
+        values = {}
+        if self.credentials.version == "v1":
+            return values
+        if plan is None:
+            plan = self.plan_columns(oids)
+        replies = await asyncio.gather(
+            *(
+                self.async_get_column_group(columns, max_repetitions, retries, start_oids)
+                for columns, start_oids, max_repetitions, _oids in plan
+            ),
+            return_exceptions=True,
+        )
+        for (_columns, _start_oids, _max_repetitions, column_oids), reply in zip(plan, replies):
+            if not isinstance(reply, dict):
+                continue
+            for oid, reply_oid in column_oids:
+                value = reply.get(reply_oid)
+                if value is not None:
+                    values[oid] = value
+        _LOGGER.debug("Column GETBULKs answered %d of %d OIDs in %d requests", len(values), len(oids), len(plan))
+        return values
+
     async def async_get_subtree(self, oid, retries=1, max_repetitions=25):
         """Retrieve all values in the OID subtree using pysnmp bulk walk."""
         result = {}
@@ -334,8 +591,9 @@ class SnmpClient:
             try:
                 engine, auth_data, transport, context, _ = await self._prepare_snmp_args(oid)
 
-                # bulk_walk_cmd is an async generator
-                async for error_indication, error_status, error_index, var_binds in bulk_walk_cmd(
+                # bulk_walk_cmd is an async generator; the walk holds one slot for its whole run.
+                # aclosing() finalizes it right away if the walk fails or the poll is cancelled.
+                walk = bulk_walk_cmd(
                     engine,
                     auth_data,
                     transport,
@@ -345,13 +603,15 @@ class SnmpClient:
                     ObjectType(ObjectIdentity(oid)),  # required varBind
                     lexicographicMode=False,
                     lookupMib=False,
-                ):
-                    if error_indication:
-                        raise Exception(error_indication)
-                    if error_status:
-                        raise Exception(error_status.prettyPrint())
+                )
+                async with self._inflight, aclosing(walk):
+                    async for error_indication, error_status, error_index, var_binds in walk:
+                        if error_indication:
+                            raise Exception(error_indication)
+                        if error_status:
+                            raise Exception(error_status.prettyPrint())
 
-                    self._parse_var_binds(var_binds, normalized_base_oid, result, source="bulk_walk")
+                        self._parse_var_binds(var_binds, normalized_base_oid, result, source="bulk_walk")
 
                 return result if result else None
 
@@ -380,9 +640,10 @@ class SnmpClient:
             try:
                 while port_count < max_ports:
                     args = await self._prepare_snmp_args(current_oid)
-                    error_indication, error_status, error_index, var_binds = await next_cmd(
-                        *args, lexicographicMode=False, lookupMib=False
-                    )
+                    async with self._inflight:
+                        error_indication, error_status, error_index, var_binds = await next_cmd(
+                            *args, lexicographicMode=False, lookupMib=False
+                        )
 
                     if error_indication or error_status:
                         break
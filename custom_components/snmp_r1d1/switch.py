@@ -22,27 +22,16 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator: SnmpDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     device_info_data = config_entry.data.get(CONF_DEVICE_INFO, {})
 
-    # Device metadata for HA registry
-    device_info = {
-        "identifiers": {(DOMAIN, config_entry.data[CONF_DEVICE_IP])},
-        "name": config_entry.data[CONF_DEVICE_NAME],
-        "manufacturer": device_info_data.get("manufacturer", "Unknown"),
-        "model": device_info_data.get("model", "Unknown"),
-    }
+    # Device metadata for HA registry (shared, built once on the coordinator)
+    device_info = coordinator.device_info
 
     entities = []
 
     # ----------------------------
     # MAC table switches (always created, independent of CONF_ENABLE_CONTROLS)
     # ----------------------------
-    has_mac_table = any(
-        entry.get("type") == "mac_table"
-        for entry in coordinator.validated_oids.get("device", {}).values()
-    )
-    has_mac_port = any(
-        entry.get("type") == "mac_port"
-        for entry in coordinator.validated_oids.get("device", {}).values()
-    )
+    has_mac_table = bool(coordinator.oids_for_type("mac_table")["device"])
+    has_mac_port = bool(coordinator.oids_for_type("mac_port")["device"])
 
     if has_mac_table and has_mac_port:
         port_count = int(device_info_data.get("port_count", 1))
@@ -62,16 +51,15 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     # SNMP control switches (only if CONF_ENABLE_CONTROLS is set)
     # ----------------------------
     if config_entry.data.get(CONF_ENABLE_CONTROLS, False):
-        for key, entry in coordinator.validated_oids.get("device", {}).items():
-            if entry.get("type") == "switch":
-                entities.append(SnmpDeviceSwitch(coordinator, device_info, key, entry))
-                _LOGGER.info("Added device switch: %s", key)
-
-        for port_key, port_attrs in coordinator.validated_oids.get("ports", {}).items():
-            for key, entry in port_attrs.items():
-                if entry.get("type") == "switch":
-                    entities.append(SnmpPortSwitch(coordinator, device_info, key, entry, port_key))
-                    _LOGGER.info("Added port switch: %s_%s", port_key, key)
+        switch_oids = coordinator.oids_for_type("switch")
+        for key, entry in switch_oids["device"]:
+            entities.append(SnmpDeviceSwitch(coordinator, device_info, key, entry))
+            _LOGGER.info("Added device switch: %s", key)
+
+        for port_key, port_attrs in switch_oids["ports"].items():
+            for key, entry in port_attrs:
+                entities.append(SnmpPortSwitch(coordinator, device_info, key, entry, port_key))
+                _LOGGER.info("Added port switch: %s_%s", port_key, key)
     else:
         _LOGGER.info("Controls disabled, skipping SNMP control switches")
 
@@ -98,6 +86,8 @@ class SnmpDeviceSwitch(SwitchEntity):
         # Human-readable name
         self._attr_name = make_entity_name(switch_type)
         self._entry = entry
+        self._bool_vmap = compile_bool_vmap(entry.get("vmap"))  # Parsed once, applied on every state read
+        self._values = coordinator.device_view  # Live read-only view of device values
 
     async def async_added_to_hass(self):
         """Register update listener when entity is added."""
@@ -106,12 +96,10 @@ class SnmpDeviceSwitch(SwitchEntity):
     @property
     def is_on(self):
         """Return ON/OFF state of the switch."""
-        if not self.coordinator.data or "device" not in self.coordinator.data:
-            return None
-        raw_value = self.coordinator.data["device"].get(self.switch_type)
+        raw_value = self._values.get(self.switch_type)
         if raw_value is None:
             return None
-        return apply_bool_vmap(raw_value, self._entry.get("vmap", {}), self._attr_unique_id)
+        return apply_compiled_bool_vmap(raw_value, self._bool_vmap)
         
     async def async_turn_on(self, **kwargs):
         """Send SNMP set to turn switch ON."""
@@ -128,10 +116,10 @@ class SnmpDeviceSwitch(SwitchEntity):
     @property
     def extra_state_attributes(self):
         """Optional attributes: firmware version."""
-        if not self.coordinator.data or "device" not in self.coordinator.data:
+        if not self._values:
             return {}
         return {
-            "firmware": self.coordinator.data["device"].get("firmware", "Unknown"),
+            "firmware": self._values.get("firmware", "Unknown"),
         }
   
 # ================================================================
@@ -153,6 +141,8 @@ class SnmpPortSwitch(SwitchEntity):
         # Human-readable name: Port-05 Admin State
         self._attr_name = make_entity_name(switch_type, port_key=padded_port_key)
         self._entry = entry
+        self._bool_vmap = compile_bool_vmap(entry.get("vmap"))  # Parsed once, applied on every state read
+        self._values = coordinator.port_view(padded_port_key)  # Live read-only view of this port's values
 
     async def async_added_to_hass(self):
         """Register update listener when entity is added."""
@@ -161,13 +151,10 @@ class SnmpPortSwitch(SwitchEntity):
     @property
     def is_on(self):
         """Return ON/OFF state for the port switch."""
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
-            return None
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        raw_value = port_data.get(self.switch_type)
+        raw_value = self._values.get(self.switch_type)
         if raw_value is None:
             return None
-        return apply_bool_vmap(raw_value, self._entry.get("vmap", {}), self._attr_unique_id)
+        return apply_compiled_bool_vmap(raw_value, self._bool_vmap)
 
     async def async_turn_on(self, **kwargs):
         """Send SNMP set to turn port switch ON."""
@@ -184,9 +171,8 @@ class SnmpPortSwitch(SwitchEntity):
     @property
     def extra_state_attributes(self):
         """Optional attributes: include port name if available."""
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
+        if not self._values:
             return {}
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        return {            
-            "port_name": port_data.get("port_name", "Unknown")
+        return {
+            "port_name": self._values.get("port_name", "Unknown")
         }
\ No newline at end of file
@@ -16,34 +16,27 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator: SnmpDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     device_info_data = config_entry.data.get(CONF_DEVICE_INFO, {})
 
-    device_info = {
-        "identifiers": {(DOMAIN, config_entry.data[CONF_DEVICE_IP])},
-        "name": config_entry.data[CONF_DEVICE_NAME],
-        "manufacturer": device_info_data.get("manufacturer", "Unknown"),
-        "model": device_info_data.get("model", "Unknown"),
-    }
+    # Device metadata for HA registry (shared, built once on the coordinator)
+    device_info = coordinator.device_info
 
     entities = []
 
+    # Pre-partitioned "text" OIDs (built once on the coordinator)
+    text_oids = coordinator.oids_for_type("text")
+
     # Device-level text entities
-    for key, entry in coordinator.validated_oids.get("device", {}).items():
-        if entry.get("type") == "text":
-            entities.append(SnmpDeviceText(coordinator, device_info, key, entry))
-            _LOGGER.debug(f"Added device text entity: {key}")
+    for key, entry in text_oids["device"]:
+        entities.append(SnmpDeviceText(coordinator, device_info, key, entry))
+        _LOGGER.debug(f"Added device text entity: {key}")
 
     # Port-level text entities with zero-padded keys
     port_count = int(device_info_data.get("port_count", 1))
-    ports_oids = coordinator.validated_oids.get("ports", {})
+    ports_oids = text_oids["ports"]
     _LOGGER.info("Processing %d ports for text entities", port_count)
-    for port_key in sorted(ports_oids.keys(), key=lambda x: int(x[1:])):
-        if int(port_key[1:]) > port_count:
-            _LOGGER.warning(f"Skipping port {port_key}: exceeds port_count {port_count}")
-            continue
-        port_attrs = ports_oids[port_key]
-        for key, entry in port_attrs.items():
-            if entry.get("type") == "text":
-                entities.append(SnmpPortText(coordinator, device_info, key, entry, port_key))
-                _LOGGER.debug(f"Added port text entity: {port_key}_{key}")
+    for port_key in coordinator.port_keys:  # Pre-sorted numerically, capped at port_count
+        for key, entry in ports_oids.get(port_key, ()):
+            entities.append(SnmpPortText(coordinator, device_info, key, entry, port_key))
+            _LOGGER.debug(f"Added port text entity: {port_key}_{key}")
 
     if not entities:
         _LOGGER.info("No text entities added for this device")
@@ -68,6 +61,7 @@ class SnmpDeviceText(TextEntity):
         self._entry = entry
         self._attr_mode = "text"
         self._attr_max = 64
+        self._values = coordinator.device_view  # Live read-only view of device values
 
     async def async_added_to_hass(self):
         """Register listener when entity is added."""
@@ -77,10 +71,10 @@ class SnmpDeviceText(TextEntity):
     @property
     def native_value(self):
         """Return the current value of the text entity."""
-        if not self.coordinator.data or "device" not in self.coordinator.data:
-            _LOGGER.debug(f"No device data for {self.text_type}")
+        if not self._values:
+            _LOGGER.debug("No device data for %s", self.text_type)
             return None
-        value = self.coordinator.data["device"].get(self.text_type)
+        value = self._values.get(self.text_type)
         return value if value is not None else ""
 
     async def async_set_value(self, value: str):
@@ -93,9 +87,9 @@ class SnmpDeviceText(TextEntity):
 
     @property
     def extra_state_attributes(self):
-        if not self.coordinator.data or "device" not in self.coordinator.data:
+        if not self._values:
             return {}
-        return {"firmware": self.coordinator.data["device"].get("firmware", "Unknown")}
+        return {"firmware": self._values.get("firmware", "Unknown")}
 
 class SnmpPortText(TextEntity):
     """Representation of a port-level text entity (e.g., ifAlias)."""
@@ -115,6 +109,7 @@ class SnmpPortText(TextEntity):
         self._entry = entry
         self._attr_mode = "text"
         self._attr_max = 64
+        self._values = coordinator.port_view(padded_port_key)  # Live read-only view of this port's values
 
     async def async_added_to_hass(self):
         """Register listener when entity is added."""
@@ -124,11 +119,10 @@ class SnmpPortText(TextEntity):
     @property
     def native_value(self):
         """Return the current value of the text entity."""
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
-            _LOGGER.debug(f"No port data for {self.padded_port_key}_{self.text_type}")
+        if not self._values:
+            _LOGGER.debug("No port data for %s_%s", self.padded_port_key, self.text_type)
             return None
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        value = port_data.get(self.text_type)
+        value = self._values.get(self.text_type)
         return value if value is not None else ""
 
     async def async_set_value(self, value: str):
@@ -141,8 +135,6 @@ class SnmpPortText(TextEntity):
 
     @property
     def extra_state_attributes(self):
-        if not self.coordinator.data or "ports" not in self.coordinator.data:
+        if not self._values:
             return {}
-        port_data = self.coordinator.data["ports"].get(self.padded_port_key, {})
-        port_name = port_data.get("port_name", "Unknown")
-        return {"port_name": port_name}
\ No newline at end of file
+        return {"port_name": self._values.get("port_name", "Unknown")}
\ No newline at end of file